@@ -0,0 +1,55 @@
+"""Micro-benchmark of the IBBLOB bind processor
+
+Measures the bytes allocated and the time spent per bound value for bytes,
+bytearray and memoryview payloads, comparing the previous processor, which
+always called bytes(value), with the current one. No database is required.
+
+    python bench_binary_binds.py [payload_size] [rows]
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+from sqlalchemy_interbase import *
+from sqlalchemy_interbase.base import IBDialect
+
+payload_size = int(sys.argv[1]) if len(sys.argv) > 1 else 64 * 1024
+rows = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+
+def previous_processor(value):
+    if value is None:
+        return None
+    return bytes(value)
+
+
+current_processor = IBBLOB().bind_processor(IBDialect())
+
+payloads = {
+    'bytes': bytes(payload_size),
+    'bytearray': bytearray(payload_size),
+    'memoryview': memoryview(bytearray(payload_size)),
+}
+
+
+def allocated_per_row(process, value):
+    tracemalloc.start()
+    results = [process(value) for _ in range(rows)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return allocated // rows
+
+
+def time_per_row(process, value):
+    return timeit.timeit(lambda: process(value), number=rows) / rows * 1e9
+
+
+print(f"payload {payload_size} bytes, {rows} rows")
+print(f"{'value':<12}{'processor':<12}{'bytes/row':>12}{'ns/row':>12}")
+for name, value in payloads.items():
+    for label, process in (('previous', previous_processor), ('current', current_processor)):
+        print(f"{name:<12}{label:<12}"
+              f"{allocated_per_row(process, value):>12}"
+              f"{time_per_row(process, value):>12.0f}")
@@ -0,0 +1,67 @@
+"""Benchmark of the normalize_name() / denormalize_name() caches of IBDialect
+
+Normalizes the names of a synthetic catalogue of 100k columns (2000 tables
+of 50 columns) the way a reflection does, every name several times, with
+and without the caches. No database is needed.
+
+    python bench_name_normalization.py
+"""
+
+import timeit
+
+from sqlalchemy.engine import default
+
+from sqlalchemy_interbase.base import IBDialect
+from sqlalchemy_interbase.ib_info import RESERVED_WORDS
+
+repeat = 5
+
+tables = 2000
+columns_per_table = 50
+reserved_words = sorted(RESERVED_WORDS)
+
+
+def stored_name(table, column):
+    # As in rdb$relation_fields: mostly upper case, some quoted mixed case
+    #   names and reserved words
+    if column % 10 == 0:
+        return "Col_%d_%d" % (table, column)
+    if column % 25 == 1:
+        return reserved_words[(table + column) % len(reserved_words)].upper()
+    return "COLUMN_%d_%d" % (table, column)
+
+
+catalogue = [
+    stored_name(table, column)
+    for table in range(tables)
+    for column in range(columns_per_table)
+]
+# Names of columns, primary keys, indexes, foreign keys, ... of every table
+reflected = catalogue * 4
+
+
+def normalize(normalize_name, denormalize_name):
+    for name in reflected:
+        denormalize_name(normalize_name(name))
+
+
+uncached = IBDialect()
+cached = IBDialect()
+
+print(f"{len(catalogue)} column names, {len(reflected)} reflected names")
+print(f"{'mode':<10}{'ms':>10}")
+for mode, dialect, normalize_name, denormalize_name in (
+    (
+        'uncached',
+        uncached,
+        lambda name: default.DefaultDialect.normalize_name(uncached, name),
+        lambda name: default.DefaultDialect.denormalize_name(uncached, name),
+    ),
+    ('cached', cached, cached.normalize_name, cached.denormalize_name),
+):
+    seconds = min(
+        timeit.repeat(
+            lambda: normalize(normalize_name, denormalize_name), number=1, repeat=repeat
+        )
+    )
+    print(f"{mode:<10}{seconds * 1000:>10.1f}")
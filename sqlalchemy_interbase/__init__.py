@@ -10,3 +10,4 @@ from sqlalchemy_interbase.types import *
 # from sqlalchemy.dialects import registry
 # base.dialect = dialect = IBDialect
 # registry.register("interbase", __name__, "IBDialect")
+# registry.register("interbase.async", "sqlalchemy_interbase.async_dialect", "IBDialect_async")
@@ -1,28 +1,50 @@
 # Allow circular references between IBDialect and IBInspector
 from __future__ import annotations
 
+import collections
+import contextlib
+import itertools
+import re
+import threading
+import time
+import weakref
 from typing import List
 from typing import Optional
 
 import interbase as interbase_driver
 from packaging import version
 from sqlalchemy import __version__ as SQLALCHEMY_VERSION
+from sqlalchemy import event
 from sqlalchemy import exc
 from sqlalchemy import schema as sa_schema
 from sqlalchemy import sql
 from sqlalchemy import text
 from sqlalchemy import types as sa_types
 from sqlalchemy import util
+from sqlalchemy.engine import characteristics
+from sqlalchemy.engine import cursor as _cursor
 from sqlalchemy.engine import default
 from sqlalchemy.engine import reflection
 from sqlalchemy.engine.interfaces import BindTyping
 from sqlalchemy.sql import coercions
 from sqlalchemy.sql import compiler
 from sqlalchemy.sql import expression
+from sqlalchemy.sql import operators
 from sqlalchemy.sql import roles
+from sqlalchemy.sql.ddl import _CreateDropBase
 
 import sqlalchemy_interbase.types as ib_types
-from sqlalchemy_interbase.ib_info import MAX_IDENTIFIER_LENGTH, RESERVED_WORDS
+from sqlalchemy_interbase.ib_info import (
+    BOOLEAN_VERSION,
+    MAX_CONTEXTS,
+    MAX_IDENTIFIER_LENGTH,
+    MAX_IN_LIST_ITEMS,
+    MAX_MESSAGE_LENGTH,
+    MAX_STATEMENT_LENGTH,
+    RESERVED_WORDS,
+    VERSION_NAMES,
+)
+from sqlalchemy_interbase.reflection_cache import ReflectionCache
 
 # Expression separator for COMPUTER BY expressions
 EXPRESSION_SEPARATOR = "||"
@@ -33,6 +55,48 @@ def coalesce(*arg):
     return next((a for a in arg if a is not None), None)
 
 
+# Statements changing metadata, cached prepared statements are dropped before they run
+_DDL_STATEMENT = re.compile(r"\s*(CREATE|ALTER|DROP|RECREATE)\b", re.I)
+
+# Error codes of a lost attachment, see IBDialect.is_disconnect
+_DISCONNECT_GDSCODES = {
+    335544324,  # bad_db_handle      Invalid database handle (no active connection)
+    335544375,  # unavailable        Unavailable database
+    335544506,  # shutinprog         Database shutdown in progress
+    335544528,  # shutdown           Database shutdown
+    335544648,  # conn_lost          Connection lost to pipe server
+    335544721,  # network_error      Unable to complete network request to host "@1"
+    335544726,  # net_read_err       Error reading data from the connection
+    335544727,  # net_write_err      Error writing data to the connection
+    335544741,  # lost_db_connection Connection lost to database
+    335544856,  # att_shutdown       Connection shutdown (killed, idle timeout, database shutdown)
+}
+
+# Global temporary table of the long IN lists, see in_list_table()
+IN_LIST_TABLE = "SQLA_IN_LIST"
+IN_LIST_STR_LENGTH = 255
+
+# Names kept by IBDialect.normalize_name() / denormalize_name()
+NAME_CACHE_SIZE = 131072
+
+
+# Comparisons rendered as "<left> <op> <right>", see IBCompiler.visit_binary
+_DIRECT_COMPARISONS = {
+    operators.eq,
+    operators.ne,
+    operators.lt,
+    operators.le,
+    operators.gt,
+    operators.ge,
+    operators.like_op,
+    operators.not_like_op,
+    operators.is_distinct_from,
+    operators.is_not_distinct_from,
+    operators.in_op,
+    operators.not_in_op,
+}
+
+
 class IBCompiler(sql.compiler.SQLCompiler):
     def render_bind_cast(self, type_, dbapi_type, sqltext):
         return f"""CAST({sqltext} AS {
@@ -41,6 +105,177 @@ class IBCompiler(sql.compiler.SQLCompiler):
         )
         })"""
 
+    # bind_casts="selective": binds whose type the server infers from a column
+    #   aren't cast, i.e. "col <op> ?" comparisons and UPDATE SET values.
+    #   Select-list binds, function arguments, CASE branches and INSERT values
+    #   (also rendered as SELECT ... UNION ALL, see _deliver_insertmanyvalues_batches)
+    #   are still cast, as are the binds of operators rewritten around their
+    #   operands (ilike, contains, startswith, ...).
+    def visit_binary(self, binary, **kw):
+        kw.pop("_ib_inferred_bind", None)
+        if (
+            self.dialect.bind_casts == "selective"
+            and binary.operator in _DIRECT_COMPARISONS
+        ):
+            left, right = binary.left, binary.right
+            if isinstance(right, expression.BindParameter) and isinstance(
+                left, expression.ColumnClause
+            ):
+                kw["_ib_inferred_bind"] = right
+            elif isinstance(left, expression.BindParameter) and isinstance(
+                right, expression.ColumnClause
+            ):
+                kw["_ib_inferred_bind"] = left
+        return super().visit_binary(binary, **kw)
+
+    def visit_bindparam(self, bindparam, **kw):
+        # Only the operand itself, not a bind nested in its rendering
+        inferred = kw.pop("_ib_inferred_bind", None) is bindparam or (
+            self.dialect.bind_casts == "selective"
+            and bindparam._is_crud
+            and self.isupdate
+        )
+        if inferred and not bindparam.type._has_bind_expression:
+            kw["_ib_inferred_bind"] = True
+        return super().visit_bindparam(bindparam, **kw)
+
+    def bindparam_string(self, name, _ib_inferred_bind=False, **kw):
+        if _ib_inferred_bind:
+            kw["bindparam_type"] = None
+        return super().bindparam_string(name, **kw)
+
+    # Expanding IN lists longer than MAX_IN_LIST_ITEMS are split when the
+    #   statement is executed: (col IN (?, ...) OR col IN (?, ...)).
+    #   Lists longer than the dialect's in_list_temp_table_threshold are loaded
+    #   in the SQLA_IN_LIST global temporary table (see in_list_table()) instead:
+    #   col IN (SELECT INT_VALUE FROM SQLA_IN_LIST WHERE LIST_ID = ?)
+    #   So are lists exceeding MAX_STATEMENT_LENGTH or MAX_MESSAGE_LENGTH once
+    #   rendered, without a threshold they raise ArgumentError.
+    @util.memoized_property
+    def _ib_in_lists(self):
+        # Escaped name of the expanding bind -> (left operand SQL, operator, inferred bind)
+        return {}
+
+    def visit_in_op_binary(self, binary, operator, **kw):
+        return self._ib_in_list_binary(binary, " IN ", **kw)
+
+    def visit_not_in_op_binary(self, binary, operator, **kw):
+        return self._ib_in_list_binary(binary, " NOT IN ", **kw)
+
+    def _ib_in_list_binary(self, binary, opstring, **kw):
+        sql_text = self._generate_generic_binary(binary, opstring, **kw)
+        bind = binary.right
+        if not (
+            isinstance(bind, expression.BindParameter)
+            and bind.expanding
+            and not bind.literal_execute
+        ):
+            # NOT IN is parenthesized as in SQLCompiler.visit_not_in_op_binary
+            return sql_text if opstring == " IN " else "(%s)" % sql_text
+
+        match = self._post_compile_pattern.search(sql_text)
+        suffix = match and "%s(%s)" % (opstring, match.group(0))
+        # Lists with a bind_expression are rendered by SQLAlchemy item by item
+        if suffix and not match.group(2) and sql_text.endswith(suffix):
+            name = match.group(1)
+            left = sql_text[: -len(suffix)]
+            in_list = (
+                # A left operand with binds can't be repeated, the list is then
+                #   only loaded in the temporary table
+                None if self._positional_pattern.search(left) else left,
+                opstring,
+                self.dialect.bind_casts == "selective"
+                and isinstance(binary.left, expression.ColumnClause),
+            )
+            # The same list compared to different expressions isn't split
+            self._ib_in_lists[name] = (
+                in_list if self._ib_in_lists.get(name, in_list) == in_list else None
+            )
+
+        # The split list is joined with OR / AND
+        return "(%s)" % sql_text
+
+    def _literal_execute_expanding_parameter(self, name, parameter, values):
+        to_update, replacement_expression = super()._literal_execute_expanding_parameter(
+            name, parameter, values
+        )
+        in_list = self._ib_in_lists.get(name)
+        typ = parameter.type._unwrapped_dialect_impl(self.dialect)
+        if (
+            in_list is None
+            or parameter.literal_execute
+            or not values
+            or typ._is_tuple_type
+            or len(to_update) != len(values)
+        ):
+            return to_update, replacement_expression
+
+        left, opstring, inferred = in_list
+        if self._numeric_binds:
+            bind_template = self.compilation_bindtemplate
+        else:
+            bind_template = self.bindtemplate
+
+        if left is not None:
+            items = [bind_template % {"name": key} for key, _ in to_update]
+            if (
+                not inferred
+                and self.dialect._bind_typing_render_casts
+                and typ.render_bind_cast
+            ):
+                items = [self.render_bind_cast(parameter.type, typ, item) for item in items]
+
+            replacement_expression = (")%s%s%s(" % (
+                " OR " if opstring == " IN " else " AND ", left, opstring
+            )).join(
+                ", ".join(items[start:start + MAX_IN_LIST_ITEMS])
+                for start in range(0, len(items), MAX_IN_LIST_ITEMS)
+            )
+
+        # Split or not, the list has to fit in the statement text and in the
+        #   input message, with the rest of the statement
+        oversized = (
+            len(replacement_expression) > MAX_STATEMENT_LENGTH - len(self.string)
+            or len(values) * self._ib_message_length(typ) > MAX_MESSAGE_LENGTH
+        )
+        threshold = self.dialect.in_list_temp_table_threshold
+        if oversized or (threshold is not None and len(values) > threshold):
+            column = _in_list_column(values)
+            # A single parameter carries the values, see IBExecutionContext._load_in_lists
+            if (
+                threshold is not None
+                and column is not None
+                and typ._cached_bind_processor(self.dialect) is None
+            ):
+                key = "%s_in_list" % name
+                return [(key, _InListValues(column, values))], (
+                    "SELECT %s FROM %s WHERE LIST_ID = %s"
+                    % (column, IN_LIST_TABLE, bind_template % {"name": key})
+                )
+            if oversized:
+                raise exc.ArgumentError(
+                    "IN list of %d items exceeds the statement length or the "
+                    "message size of the server, load it in the %s table with "
+                    "the in_list_temp_table_threshold dialect argument "
+                    "(integers or strings only)" % (len(values), IN_LIST_TABLE)
+                )
+
+        return to_update, replacement_expression
+
+    def _process_parameters_for_postcompile(self, parameters, _populate_self=False):
+        expanded_state = super()._process_parameters_for_postcompile(
+            parameters, _populate_self
+        )
+        # Each IN list fits, several of them may not
+        if len(expanded_state.statement) > MAX_STATEMENT_LENGTH:
+            raise exc.ArgumentError(
+                "Statement of %d characters with its IN lists exceeds the "
+                "statement length of the server (%d), see the "
+                "in_list_temp_table_threshold dialect argument"
+                % (len(expanded_state.statement), MAX_STATEMENT_LENGTH)
+            )
+        return expanded_state
+
     def visit_sequence(self, sequence, **kw):
         return "GEN_ID(%s, 1)" % self.preparer.format_sequence(sequence)
 
@@ -176,6 +411,156 @@ class IBCompiler(sql.compiler.SQLCompiler):
 
         return "RETURNING " + ", ".join(columns)
 
+    def visit_insert(self, insert_stmt, **kw):
+        # supports_multivalues_insert is enabled only for insertmanyvalues,
+        #   Interbase has no multirow VALUES for insert().values([...])
+        if insert_stmt._multi_values:
+            raise exc.CompileError(
+                "The '%s' dialect with current database "
+                "version settings does not support "
+                "in-place multirow inserts." % self.dialect.name
+            )
+
+        return super().visit_insert(insert_stmt, **kw)
+
+    def _ib_message_length(self, type_):
+        # Worst case size of a parameter in the input message: 4 bytes per
+        #   character for strings, 8 bytes for anything else (numbers, dates,
+        #   BLOB ids), plus 2 bytes of null indicator
+        str_length = getattr(type_, "length", None)
+        return (str_length * 4 + 2 if str_length else 8) + 2
+
+    def _insertmanyvalues_row_length(self, imv):
+        length = sum(
+            self._ib_message_length(col.type._unwrapped_dialect_impl(self.dialect))
+            for col, *_ in imv.insert_crud_params
+        )
+        return max(length, 1)
+
+    def _deliver_insertmanyvalues_batches(
+            self,
+            statement,
+            parameters,
+            compiled_parameters,
+            generic_setinputsizes,
+            batch_size,
+            sort_by_parameter_order,
+            schema_translate_map,
+    ):
+        # Interbase has no multirow VALUES, each batch is rendered as
+        #   INSERT INTO t (a, b) SELECT ?, ? FROM rdb$database UNION ALL SELECT ?, ? FROM rdb$database ...
+        imv = self._insertmanyvalues
+        values_clause = f"({imv.single_values_expr})"
+        row_select = f"SELECT {imv.single_values_expr}{self.default_from()}"
+        union_all = " UNION ALL "
+
+        # Keep every batch within the server limits
+        statement_length = len(statement) - len(values_clause)
+        batch_size = max(
+            1,
+            min(
+                batch_size,
+                MAX_CONTEXTS - 1,  # Target table takes one context
+                (MAX_STATEMENT_LENGTH - statement_length)
+                // (len(row_select) + len(union_all)),
+                MAX_MESSAGE_LENGTH // self._insertmanyvalues_row_length(imv),
+            ),
+        )
+
+        for imv_batch in super()._deliver_insertmanyvalues_batches(
+                statement,
+                parameters,
+                compiled_parameters,
+                generic_setinputsizes,
+                batch_size,
+                sort_by_parameter_order,
+                schema_translate_map,
+        ):
+            if imv_batch.current_batch_size > 1:
+                rows = imv_batch.current_batch_size
+                replaced_statement = imv_batch.replaced_statement.replace(
+                    "VALUES " + ", ".join([values_clause] * rows),
+                    union_all.join([row_select] * rows),
+                    1,
+                )
+                imv_batch = imv_batch._replace(
+                    replaced_statement=replaced_statement
+                )
+
+            yield imv_batch
+
+
+def _uses_autoincrement_trigger(column):
+    """True for an autoincrement primary key filled by a BEFORE INSERT trigger"""
+    return (
+        column.primary_key
+        and column is column.table._autoincrement_column
+        and column.identity is None
+        and (
+            column.default is None
+            or (
+                isinstance(column.default, sa_schema.Sequence)
+                and column.default.optional
+            )
+        )
+    )
+
+
+# Autoincrement names longer than MAX_IDENTIFIER_LENGTH are cut to
+#   <prefix>_<hash><suffix>, see _autoincrement_stored_names()
+_AUTOINCREMENT_SUFFIX_LENGTH = len("_TRG")
+_AUTOINCREMENT_HASH_LENGTH = 4
+_AUTOINCREMENT_PREFIX_LENGTH = (
+    MAX_IDENTIFIER_LENGTH - len("_") - _AUTOINCREMENT_HASH_LENGTH - _AUTOINCREMENT_SUFFIX_LENGTH
+)
+
+
+def _autoincrement_stored_names(table_name, column_name):
+    # <TABLE>_<COLUMN>_GEN and <TABLE>_<COLUMN>_TRG as stored in the system
+    #   tables. Longer names are cut as SQLAlchemy cuts long labels, with a
+    #   hash of the whole name, _columns_query finds the trigger by them
+    prefix = "%s_%s" % (table_name, column_name)
+    names = []
+    for suffix in ("_GEN", "_TRG"):
+        if len(prefix) + len(suffix) > MAX_IDENTIFIER_LENGTH:
+            names.append(
+                "%s_%s%s" % (
+                    prefix[:_AUTOINCREMENT_PREFIX_LENGTH],
+                    util.md5_hex(prefix)[-_AUTOINCREMENT_HASH_LENGTH:].upper(),
+                    suffix,
+                )
+            )
+        else:
+            names.append(prefix + suffix)
+    return tuple(names)
+
+
+def _autoincrement_names(dialect, column):
+    return tuple(
+        dialect.normalize_name(name)
+        for name in _autoincrement_stored_names(
+            dialect.denormalize_name(column.table.name),
+            dialect.denormalize_name(column.name),
+        )
+    )
+
+
+class CreateAutoincrementTrigger(_CreateDropBase):
+    """CREATE TRIGGER filling an autoincrement primary key from its generator.
+
+    Executed at the commit of the CREATE TABLE, see
+    IBDialect._autoincrement_ddl(). Inserts without a value for the column
+    get the next value of the generator on the server.
+    """
+
+    __visit_name__ = "create_autoincrement_trigger"
+
+
+class DropAutoincrementGenerator(_CreateDropBase):
+    """DROP GENERATOR of an autoincrement primary key, at the commit of DROP TABLE"""
+
+    __visit_name__ = "drop_autoincrement_generator"
+
 
 class IBDDLCompiler(sql.compiler.DDLCompiler):
     def get_column_specification(self, column, **kwargs):
@@ -187,25 +572,9 @@ class IBDDLCompiler(sql.compiler.DDLCompiler):
 
         has_identity = column.identity is not None
 
-        if (
-                column.primary_key
-                and column is column.table._autoincrement_column
-                and not has_identity
-                and (
-                column.default is None
-                or (
-                        isinstance(column.default, sa_schema.Sequence)
-                        and column.default.optional
-                )
-        )
-        ):
+        if _uses_autoincrement_trigger(column):
+            # Values from a generator, see CreateAutoincrementTrigger
             colspec += " INTEGER"
-            table_name = column.table.name
-            column_name = column.name
-            generator_name = f"{table_name}_{column_name}_gen"
-            trigger_name = f"{table_name}_{column_name}_trg"
-
-            # self.create_generator_and_trigger(table_name, column_name, generator_name, trigger_name)
         else:
             type_compiler_instance = (
                 self.dialect.type_compiler_instance
@@ -234,20 +603,24 @@ class IBDDLCompiler(sql.compiler.DDLCompiler):
 
         return colspec
 
-    def create_generator_and_trigger(self, table_name, column_name, generator_name, trigger_name):
-        """
-        REQUIRED FOR AUTOINCREMENT COLUMNS
-        TODO: find the way to execute
-        """
-        self.connection.execute(f"CREATE GENERATOR {generator_name}")
-        self.connection.execute(f"""
-            CREATE TRIGGER {trigger_name} FOR {table_name}
-            BEFORE INSERT AS
-            BEGIN
-                IF (NEW.{column_name} IS NULL) THEN
-                    NEW.{column_name} = GEN_ID({generator_name}, 1);
-            END
-        """)
+    def visit_create_autoincrement_trigger(self, create, **kw):
+        column = create.element
+        generator_name, trigger_name = _autoincrement_names(self.dialect, column)
+        column_name = self.preparer.format_column(column)
+
+        return (
+            f"CREATE TRIGGER {self.preparer.quote(trigger_name)} "
+            f"FOR {self.preparer.format_table(column.table)}\n"
+            f"BEFORE INSERT AS\n"
+            f"BEGIN\n"
+            f"    IF (NEW.{column_name} IS NULL) THEN\n"
+            f"        NEW.{column_name} = GEN_ID({self.preparer.quote(generator_name)}, 1);\n"
+            f"END"
+        )
+
+    def visit_drop_autoincrement_generator(self, drop, **kw):
+        generator_name, _ = _autoincrement_names(self.dialect, drop.element)
+        return "DROP GENERATOR %s" % self.preparer.quote(generator_name)
 
     def visit_create_sequence(self, create, prefix=None, **kw):
 
@@ -359,7 +732,7 @@ class IBDDLCompiler(sql.compiler.DDLCompiler):
 
 class IBTypeCompiler(compiler.GenericTypeCompiler):
     def visit_boolean(self, type_, **kw):
-        if self.dialect.server_version_info < (3,):
+        if not self.dialect.supports_native_boolean:
             return self.visit_SMALLINT(type_, **kw)
 
         return self.visit_BOOLEAN(type_, **kw)
@@ -499,12 +872,533 @@ class IBIdentifierPreparer(sql.compiler.IdentifierPreparer):
         super().__init__(dialect, omit_schema=True)
 
 
+class _SequenceBlocks:
+    """Thread-safe "hi/lo" allocator of generator values.
+
+    A block of ``block_size`` values is reserved on the server with a single
+    ``GEN_ID(seq, block_size)`` and handed out locally until it is exhausted.
+    Generators are not transactional, so reserved values are never reused,
+    unused values of a block are lost when the engine is disposed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._blocks = {}  # sequence name -> (next value, last reserved value)
+
+    def next_value(self, sequence_name, block_size, reserve_block):
+        with self._lock:
+            next_value, last_value = self._blocks.get(sequence_name, (1, 0))
+            if next_value > last_value:
+                # GEN_ID(seq, N) returns the last value of the reserved block
+                last_value = reserve_block(block_size)
+                next_value = last_value - block_size + 1
+
+            self._blocks[sequence_name] = (next_value + 1, last_value)
+            return next_value
+
+
+def execute_prepared_many(cursor, statement, parameters):
+    """Execute statement once per parameter set, prepared once.
+
+    The driver's executemany() prepares the SQL for every parameter set and
+    only reports the row count of the last one. Returns the total row count.
+    """
+    if not isinstance(cursor, _CachedStatementCursor):
+        statement = cursor.prep(statement)
+
+    rowcount = 0
+    for parameter_set in parameters:
+        cursor.execute(statement, parameter_set)
+        rowcount += cursor.rowcount
+    return rowcount
+
+
+class _CachedStatementCursor:
+    """Driver cursor executing a cached PreparedStatement.
+
+    Closing it closes the result set only, the statement stays prepared.
+    """
+
+    __slots__ = ("_cursor", "_statement", "_cache")
+
+    def __init__(self, statement, cache):
+        self._cursor = statement.cursor
+        self._statement = statement
+        self._cache = cache
+
+    def execute(self, operation, parameters=None):
+        # operation is the SQL of the cached statement
+        self._cursor.execute(self._statement, parameters)
+
+    def close(self):
+        try:
+            self._cursor.close()
+        finally:
+            self._cache.release(self._statement)
+
+    @property
+    def arraysize(self):
+        return self._cursor.arraysize
+
+    @arraysize.setter
+    def arraysize(self, value):
+        self._cursor.arraysize = value
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class _StatementCache:
+    """LRU cache of the prepared statements of a DBAPI connection, keyed by SQL.
+
+    A statement whose result is still open is not shared, the SQL is then
+    executed without the cache.
+    """
+
+    def __init__(self, size, ddl_generation):
+        self.size = size
+        self.ddl_generation = ddl_generation
+        self.hits = 0
+        self.misses = 0
+        self._statements = collections.OrderedDict()  # SQL -> PreparedStatement
+        self._in_use = set()
+
+    def __len__(self):
+        return len(self._statements)
+
+    def checkout(self, dbapi_connection, sql):
+        statement = self._statements.get(sql)
+        if statement is not None:
+            if statement in self._in_use:
+                return None
+            self._statements.move_to_end(sql)
+            self.hits += 1
+        else:
+            self.misses += 1
+            # One driver cursor per statement, a PreparedStatement only runs on its own cursor
+            statement = self._statements[sql] = dbapi_connection.cursor().prep(sql)
+            if len(self._statements) > self.size:
+                # Evicted statements in use are dropped once their cursor is released
+                self._statements.popitem(last=False)
+
+        self._in_use.add(statement)
+        return _CachedStatementCursor(statement, self)
+
+    def release(self, statement):
+        self._in_use.discard(statement)
+
+    def clear(self):
+        # Prepared statements hold existence locks on the objects they use
+        self._statements.clear()
+
+
+# Isolation level names -> the canonical name returned by get_isolation_level()
+_ISOLATION_LEVELS = {
+    "READ COMMITTED": "READ COMMITTED",
+    "REPEATABLE READ": "REPEATABLE READ",
+    "SNAPSHOT": "REPEATABLE READ",
+    "SERIALIZABLE": "SERIALIZABLE",
+    "SNAPSHOT TABLE STABILITY": "SERIALIZABLE",
+}
+
+# Transaction parameters of the driver's default TPB (ISOLATION_LEVEL_READ_COMMITED)
+_DEFAULT_TPB_OPTIONS = {
+    "isolation_level": "READ COMMITTED",
+    "read_only": False,
+    "rec_version": True,
+    "wait": True,
+    "lock_timeout": None,
+}
+
+
+def _render_tpb(options):
+    """Transaction Parameter Block of the options of a connection"""
+    ib = interbase_driver
+    tpb = ib.TPB()
+    tpb.access_mode = ib.isc_tpb_read if options["read_only"] else ib.isc_tpb_write
+
+    if options["isolation_level"] == "READ COMMITTED":
+        tpb.isolation_level = (
+            ib.isc_tpb_read_committed,
+            ib.isc_tpb_rec_version if options["rec_version"] else ib.isc_tpb_no_rec_version,
+        )
+    elif options["isolation_level"] == "SERIALIZABLE":
+        tpb.isolation_level = ib.isc_tpb_consistency
+    else:
+        tpb.isolation_level = ib.isc_tpb_concurrency
+
+    tpb.lock_resolution = ib.isc_tpb_wait if options["wait"] else ib.isc_tpb_nowait
+    return tpb.render()
+
+
+class _TPBCharacteristic(characteristics.ConnectionCharacteristic):
+    """A transaction parameter set by an interbase_* execution option"""
+
+    __slots__ = ("option",)
+
+    transactional = True
+
+    def __init__(self, option):
+        self.option = option
+
+    def reset_characteristic(self, dialect, dbapi_conn):
+        dialect._set_tpb_option(dbapi_conn, self.option, _DEFAULT_TPB_OPTIONS[self.option])
+
+    def set_characteristic(self, dialect, dbapi_conn, value):
+        dialect._set_tpb_option(dbapi_conn, self.option, value)
+
+    def get_characteristic(self, dialect, dbapi_conn):
+        return dialect._tpb_options(dbapi_conn)[self.option]
+
+
+class _CommitRetainingCharacteristic(characteristics.ConnectionCharacteristic):
+    """The interbase_commit_retaining execution option"""
+
+    __slots__ = ()
+
+    def reset_characteristic(self, dialect, dbapi_conn):
+        dialect._retaining_transactions.state(dbapi_conn).enabled = None
+
+    def set_characteristic(self, dialect, dbapi_conn, value):
+        dialect._retaining_transactions.state(dbapi_conn).enabled = value
+
+    def get_characteristic(self, dialect, dbapi_conn):
+        return dialect._retaining_transactions.enabled(dbapi_conn)
+
+
+class _RetainingState:
+    __slots__ = ("enabled", "retained", "started", "hard_end")
+
+    def __init__(self):
+        self.enabled = None  # None: the dialect's commit_retaining
+        self.retained = 0  # COMMIT / ROLLBACK RETAINING since the transaction started
+        self.started = time.monotonic()
+        self.hard_end = False  # The next end isn't retaining: pool reset, new TPB
+
+
+class _RetainingTransactions:
+    """Decides when commits and rollbacks keep the transaction open (RETAINING).
+
+    Every max_commits ends, once the transaction is max_seconds old and when
+    the pool resets the connection, the transaction is ended for real, an
+    open transaction holds back garbage collection.
+    """
+
+    def __init__(self, enabled, max_commits, max_seconds):
+        self.default_enabled = enabled
+        self.max_commits = max_commits
+        self.max_seconds = max_seconds
+        self.retaining_commits = 0
+        self.hard_commits = 0
+        self.retaining_rollbacks = 0
+        self.hard_rollbacks = 0
+        self._lock = threading.Lock()
+        self._states = weakref.WeakKeyDictionary()  # DBAPI connection -> _RetainingState
+
+    def state(self, dbapi_connection):
+        # Pool proxies are unwrapped, the state belongs to the DBAPI connection
+        dbapi_connection = getattr(
+            dbapi_connection, "dbapi_connection", dbapi_connection
+        )
+        state = self._states.get(dbapi_connection)
+        if state is None:
+            state = self._states[dbapi_connection] = _RetainingState()
+        return state
+
+    def enabled(self, dbapi_connection):
+        return coalesce(self.state(dbapi_connection).enabled, self.default_enabled)
+
+    def retain(self, dbapi_connection):
+        """True if the next commit or rollback keeps the transaction open"""
+        state = self.state(dbapi_connection)
+        return (
+            coalesce(state.enabled, self.default_enabled)
+            and not state.hard_end
+            and state.retained + 1 < self.max_commits
+            and time.monotonic() - state.started < self.max_seconds
+        )
+
+    def ended(self, dbapi_connection, retaining, commit):
+        state = self.state(dbapi_connection)
+        state.hard_end = False
+        if retaining:
+            state.retained += 1
+        else:
+            state.retained = 0
+            state.started = time.monotonic()
+
+        with self._lock:
+            if commit and retaining:
+                self.retaining_commits += 1
+            elif commit:
+                self.hard_commits += 1
+            elif retaining:
+                self.retaining_rollbacks += 1
+            else:
+                self.hard_rollbacks += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "retaining_commits": self.retaining_commits,
+                "hard_commits": self.hard_commits,
+                "retaining_rollbacks": self.retaining_rollbacks,
+                "hard_rollbacks": self.hard_rollbacks,
+            }
+
+
+class _BlobTransaction:
+    """Lifetime of the BLOB handles fetched in a transaction"""
+
+    __slots__ = ("active",)
+
+    def __init__(self):
+        self.active = True
+
+
+def _ddl_tables(element):
+    """Full names of the tables a DDL statement depends on, and of the tables
+    it creates or drops. None for an unknown statement.
+    """
+    target = getattr(element, "element", None)
+    if isinstance(target, sa_schema.Sequence):
+        # Generators are independent of the tables
+        return set(), set()
+    if isinstance(target, sa_schema.Table):
+        table = target
+        foreign_keys = table.foreign_keys
+    elif isinstance(target, (sa_schema.Column, sa_schema.Index, sa_schema.Constraint)):
+        table = target.table
+        foreign_keys = target.elements if isinstance(target, sa_schema.ForeignKeyConstraint) else ()
+    else:
+        return None
+
+    # "[schema.]table.column" is read without resolving the referred column
+    tables = {table.fullname} | {fk.target_fullname.rsplit(".", 1)[0] for fk in foreign_keys}
+    if isinstance(element, sa_schema.CreateTable):
+        return tables, {table.fullname}
+    if isinstance(element, sa_schema.DropTable):
+        # The referred tables can't be dropped before the foreign keys are gone
+        return tables, tables
+    return tables, set()
+
+
+class _DDLBatch:
+    """DDL of the transaction of a DBAPI connection, see IBDialect.ddl_batching"""
+
+    __slots__ = ("created", "waiting", "barrier", "deferred")
+
+    def __init__(self):
+        self.created = set()  # Tables created or dropped in the transaction
+        self.waiting = set()  # Tables of the deferred DDL, which keeps its order
+        self.barrier = False  # Unknown DDL is deferred, everything after it waits
+        self.deferred = []  # [(statement, tables, created)] run after the next commit
+
+    def add(self, statement, tables, created):
+        """True if the statement waits for the commit of the tables it depends on.
+
+        tables is None for an unknown statement, it may depend on any table.
+        """
+        if tables is None:
+            wait = bool(self.created or self.deferred)
+        else:
+            wait = self.barrier or tables & self.created or tables & self.waiting
+        if wait:
+            self.defer(statement, tables, created)
+            return True
+        self.created |= created
+        return False
+
+    def defer(self, statement, tables, created):
+        self.deferred.append((statement, tables, created))
+        if tables is None:
+            self.barrier = True
+        else:
+            self.waiting |= tables
+
+
+class _LazyBlobFetchStrategy(_cursor.CursorFetchStrategy):
+    """Fetches rows wrapping the BlobReader of lazy BLOB columns in IBBlobHandle"""
+
+    __slots__ = ("_positions", "_transaction")
+
+    def __init__(self, positions, transaction):
+        self._positions = positions
+        self._transaction = transaction
+
+    def _wrap(self, row):
+        row = list(row)
+        for position in self._positions:
+            if row[position] is not None:
+                row[position] = ib_types.IBBlobHandle(
+                    row[position], self._transaction
+                )
+        return tuple(row)
+
+    def yield_per(self, result, dbapi_cursor, num):
+        # Rows are wrapped as they are fetched, keep this strategy
+        pass
+
+    def fetchone(self, result, dbapi_cursor, hard_close=False):
+        row = super().fetchone(result, dbapi_cursor, hard_close)
+        return None if row is None else self._wrap(row)
+
+    def fetchmany(self, result, dbapi_cursor, size=None):
+        return [
+            self._wrap(row)
+            for row in super().fetchmany(result, dbapi_cursor, size)
+        ]
+
+    def fetchall(self, result, dbapi_cursor):
+        return [self._wrap(row) for row in super().fetchall(result, dbapi_cursor)]
+
+
+class _InListValues:
+    """Values of an IN list, loaded in SQLA_IN_LIST before the statement runs"""
+
+    __slots__ = ("column", "values")
+
+    def __init__(self, column, values):
+        self.column = column
+        self.values = values
+
+
+def _in_list_column(values):
+    """The SQLA_IN_LIST column of values, None if they can't be stored"""
+    if all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+        return "INT_VALUE"
+    if all(
+            isinstance(value, str) and len(value) <= IN_LIST_STR_LENGTH
+            for value in values
+    ):
+        return "STR_VALUE"
+    return None
+
+
 class IBExecutionContext(default.DefaultExecutionContext):
+    def _load_in_lists(self):
+        # IN lists longer than in_list_temp_table_threshold, the values are
+        #   inserted in SQLA_IN_LIST and the parameter becomes their LIST_ID.
+        #   The rows are deleted when the transaction ends (ON COMMIT DELETE ROWS).
+        cursor = None
+        try:
+            for index, parameter_set in enumerate(self.parameters):
+                if not any(isinstance(value, _InListValues) for value in parameter_set):
+                    continue
+
+                if cursor is None:
+                    cursor = self._dbapi_connection.cursor()
+                parameter_set = list(parameter_set)
+                for position, value in enumerate(parameter_set):
+                    if isinstance(value, _InListValues):
+                        parameter_set[position] = self._insert_in_list(cursor, value)
+                self.parameters[index] = self.dialect.execute_sequence_format(parameter_set)
+        finally:
+            if cursor is not None:
+                cursor.close()
+
+    def _insert_in_list(self, cursor, in_list):
+        list_id = next(self.dialect._in_list_ids)
+        if in_list.column == "INT_VALUE":
+            value_type, row_length = "BIGINT", 8 + 2
+        else:
+            value_type = "VARCHAR(%d)" % IN_LIST_STR_LENGTH
+            row_length = IN_LIST_STR_LENGTH * 4 + 2 + 2
+
+        # INSERT ... SELECT ... UNION ALL SELECT ..., as insertmanyvalues batches
+        batch_size = min(MAX_CONTEXTS - 1, MAX_MESSAGE_LENGTH // row_length)
+        values = in_list.values
+        for start in range(0, len(values), batch_size):
+            batch = values[start:start + batch_size]
+            rows = ["SELECT %d, CAST(? AS %s) FROM rdb$database" % (list_id, value_type)]
+            rows.extend(["SELECT %d, ? FROM rdb$database" % list_id] * (len(batch) - 1))
+            cursor.execute(
+                "INSERT INTO %s (LIST_ID, %s) %s"
+                % (IN_LIST_TABLE, in_list.column, " UNION ALL ".join(rows)),
+                batch,
+            )
+        return list_id
+
+    def pre_exec(self):
+        if self.dialect.in_list_temp_table_threshold is not None and self.compiled:
+            self._load_in_lists()
+
+        # Columns of BLOB types with stream=True are fetched as interbase.BlobReader,
+        #   columns of BLOB types with lazy=True as IBBlobHandle
+        self._stream_blob_positions = []
+        self._lazy_blob_positions = []
+        if self.isddl or not self.compiled or not self.compiled._result_columns:
+            return
+        if self.dialect.is_async:
+            # A reader would be read outside of the worker thread of the
+            #   connection, BLOB values are fetched in full
+            return
+
+        lazy_blobs = self.execution_options.get("interbase_lazy_blobs", False)
+        for position, result_column in enumerate(self.compiled._result_columns):
+            type_ = result_column.type.dialect_impl(self.dialect)
+            if not isinstance(type_, ib_types._IBLargeBinary):
+                continue
+            if type_.stream:
+                self._stream_blob_positions.append(position)
+            elif type_.lazy or lazy_blobs:
+                self._stream_blob_positions.append(position)
+                self._lazy_blob_positions.append(position)
+
+    def post_exec(self):
+        description = self.cursor.description
+        if not self._stream_blob_positions or not description:
+            return
+
+        self.cursor.set_stream_blob(
+            [description[position][0] for position in self._stream_blob_positions]
+        )
+
+        if self._lazy_blob_positions:
+            dbapi_connection = (
+                self.root_connection.connection.dbapi_connection
+                if self.dialect.using_sqlalchemy2
+                else self.root_connection.connection.connection
+            )
+            self.cursor_fetch_strategy = _LazyBlobFetchStrategy(
+                self._lazy_blob_positions,
+                self.dialect._blob_transaction(dbapi_connection),
+            )
+
+    def create_server_side_cursor(self):
+        # Rows are buffered by BufferedRowCursorFetchStrategy up to the
+        #   max_row_buffer execution option, arraysize sets the driver's fetchmany() size
+        if self.dialect.is_async:
+            cursor = self._dbapi_connection.cursor(server_side=True)
+        else:
+            cursor = self._dbapi_connection.cursor()
+
+        arraysize = self.execution_options.get("arraysize")
+        if arraysize:
+            cursor.arraysize = arraysize
+        return cursor
+
     def fire_sequence(self, seq, type_):
+        sequence_name = self.dialect.identifier_preparer.format_sequence(seq)
+        # Sequence doesn't accept dialect keyword arguments, the block size is
+        #   taken from Sequence.info: seq.info["interbase_block_size"] = N
+        block_size = seq.info.get("interbase_block_size")
+
+        if block_size and block_size > 1:
+            return self.dialect._sequence_blocks.next_value(
+                sequence_name,
+                block_size,
+                lambda n: self._execute_scalar(
+                    "SELECT GEN_ID(%s, %d) FROM rdb$database"
+                    % (sequence_name, n),
+                    None,
+                ),
+            )
+
         return self._execute_scalar(
             (
                     "SELECT GEN_ID(%s, 1) FROM rdb$database"
-                    % self.dialect.identifier_preparer.format_sequence(seq)
+                    % sequence_name
             ),
             type_,
         )
@@ -532,6 +1426,52 @@ class ReflectedDomain(util.typing.TypedDict):
 class IBInspector(reflection.Inspector):
     dialect: IBDialect
 
+    # info_cache key of the metadata fingerprint the cached results belong to
+    _fingerprint_key = ("reflection_cache_fingerprint",)
+
+    @util.memoized_property
+    def _reflection_cache(self):
+        # Opt-in persistent info_cache, see reflection_cache.py
+        if not self.dialect.reflection_cache_dir:
+            return None
+
+        return ReflectionCache(self.dialect.reflection_cache_dir, self.engine.url)
+
+    @contextlib.contextmanager
+    def _operation_context(self):
+        with super()._operation_context() as conn:
+            cache = self._reflection_cache
+            if cache is None:
+                yield conn
+                return
+
+            fingerprint = self.info_cache.get(self._fingerprint_key)
+            if fingerprint is None:
+                # First operation on this info_cache: a single round trip
+                #   decides if the cached results are still valid
+                fingerprint = cache.fingerprint(conn)
+                self.info_cache.update(cache.load(fingerprint) or {})
+                self.info_cache[self._fingerprint_key] = fingerprint
+                # The results not saved yet are saved with the inspector
+                self._save_unsaved = weakref.finalize(
+                    self, cache.save_unsaved, fingerprint, self.info_cache
+                )
+
+            yield conn
+
+            # Saved once the info_cache doubled, a reflection of N tables
+            #   writes O(N) entries to the file instead of O(N²)
+            if len(self.info_cache) > 2 * cache.saved_size:
+                cache.save(fingerprint, self.info_cache)
+
+    def clear_cache(self):
+        super().clear_cache()
+        if self._reflection_cache is not None:
+            save_unsaved = self.__dict__.pop("_save_unsaved", None)
+            if save_unsaved is not None:
+                save_unsaved.detach()
+            self._reflection_cache.clear()
+
     def get_domains(
             self, schema: Optional[str] = None
     ) -> List[ReflectedDomain]:
@@ -546,16 +1486,29 @@ class IBDialect(default.DefaultDialect):
 
     supports_alter = True
     supports_sane_rowcount = True
-    supports_sane_multi_rowcount = False
+    supports_sane_multi_rowcount = True
 
-    supports_native_boolean = True  # TODO: False for Firebird 2.5, have to be false for Interbase?
+    supports_native_boolean = True  # Set from the server version, see _set_capabilities
     supports_native_decimal = True
 
     supports_schemas = False
     supports_sequences = True
+
+    # The driver fetches rows on demand, see IBExecutionContext.create_server_side_cursor
+    supports_server_side_cursors = True
     sequences_optional = False
     postfetch_lastrowid = False
-    use_insertmanyvalues = False
+
+    # Batched executemany INSERTs as INSERT ... SELECT ... UNION ALL SELECT ...
+    #   See IBCompiler._deliver_insertmanyvalues_batches
+    use_insertmanyvalues = True
+    use_insertmanyvalues_wo_returning = True
+    supports_multivalues_insert = True
+    insertmanyvalues_page_size = MAX_CONTEXTS - 1
+
+    # RETURNING is singleton only, it can't return the rows of INSERT ... SELECT
+    insert_executemany_returning = False
+    insert_executemany_returning_sort_by_parameter_order = False
 
     supports_comments = True
     supports_default_values = True
@@ -580,6 +1533,23 @@ class IBDialect(default.DefaultDialect):
 
     requires_name_normalize = True
 
+    # Transaction parameters, applied from the next transaction of the connection:
+    #   connection.execution_options(
+    #       isolation_level="READ COMMITTED", interbase_read_only=True,
+    #       interbase_rec_version=True, interbase_wait=True,
+    #   )
+    #   A read-only READ COMMITTED transaction doesn't hold back garbage collection
+    connection_characteristics = default.DefaultDialect.connection_characteristics.union(
+        {
+            "interbase_read_only": _TPBCharacteristic("read_only"),
+            "interbase_rec_version": _TPBCharacteristic("rec_version"),
+            "interbase_wait": _TPBCharacteristic("wait"),
+            # Only None, the option is rejected, see _set_tpb_option()
+            "interbase_lock_timeout": _TPBCharacteristic("lock_timeout"),
+            "interbase_commit_retaining": _CommitRetainingCharacteristic(),
+        }
+    )
+
     colspecs = {
         sa_types.String: ib_types._IBString,
         sa_types.Numeric: ib_types._IBNumeric,
@@ -634,6 +1604,9 @@ class IBDialect(default.DefaultDialect):
             {
                 "descending": None,
                 "where": None,
+                # Reflected only
+                "statistics": None,
+                "inactive": None,
             },
         ),
     ]
@@ -644,6 +1617,103 @@ class IBDialect(default.DefaultDialect):
     driver = 'interbase'
     supports_statement_cache = True
 
+    def __init__(
+            self,
+            reflection_cache_dir=None,
+            bind_casts="always",
+            statement_cache_size=0,
+            in_list_temp_table_threshold=None,
+            commit_retaining=False,
+            commit_retaining_max_commits=100,
+            commit_retaining_max_seconds=60,
+            server_version=None,
+            ddl_batching=False,
+            **kwargs,
+    ):
+        super().__init__(**kwargs)
+        if bind_casts not in ("always", "selective"):
+            raise exc.ArgumentError(
+                "bind_casts must be 'always' or 'selective', got %r" % bind_casts
+            )
+        if ddl_batching not in (False, True, "statement"):
+            raise exc.ArgumentError(
+                "ddl_batching must be True, False or 'statement', got %r" % (ddl_batching,)
+            )
+        # Where bind parameters are rendered as CAST(? AS <type>), see IBCompiler.visit_binary
+        self.bind_casts = bind_casts
+        self._sequence_blocks = _SequenceBlocks()
+
+        # Known server version, "14.1" or a product name such as "2020",
+        #   also ?server_version= in the URL. See _get_server_version_info
+        self._server_version = None
+        if server_version is not None:
+            self._set_server_version(server_version)
+
+        # Directory of the persistent reflection cache, see IBInspector
+        self.reflection_cache_dir = reflection_cache_dir
+
+        # Lifetime of the lazy BLOB handles of each DBAPI connection
+        self._blob_transactions = weakref.WeakKeyDictionary()
+
+        # Prepared statements kept per DBAPI connection, 0 disables the cache.
+        #   Cached statements hold existence locks on the tables they use, they are
+        #   dropped before DDL runs (on the other connections at their next use).
+        self.statement_cache_size = statement_cache_size
+        self._ddl_generation = 0
+
+        # Number of items past which an IN list is loaded in the SQLA_IN_LIST
+        #   global temporary table, None disables it. See IBCompiler._ib_in_list_binary
+        self.in_list_temp_table_threshold = in_list_temp_table_threshold
+        self._in_list_ids = itertools.count(1)
+
+        # Transaction parameters of each DBAPI connection, see _render_tpb()
+        self._connection_tpb_options = weakref.WeakKeyDictionary()
+
+        # COMMIT RETAINING keeps the transaction open, no new transaction is
+        #   started by the next statement. Also per connection with the
+        #   interbase_commit_retaining execution option. See commit_stats.
+        #   The pool's reset on return always ends the transaction for real,
+        #   an idle pooled connection doesn't keep it open.
+        self._retaining_transactions = _RetainingTransactions(
+            commit_retaining,
+            commit_retaining_max_commits,
+            commit_retaining_max_seconds,
+        )
+
+        # A table has to be committed before an index, a foreign key or a
+        #   comment is created on it. With ddl_batching the DDL that depends
+        #   on a table of the transaction waits, the commit of the transaction
+        #   commits it and runs the waiting DDL in as many transactions as the
+        #   dependencies require. Other statements can't run while DDL waits.
+        #   metadata.create_all() runs in a few transactions instead of one
+        #   per table and index. Errors of the waiting DDL are raised by the
+        #   commit, after the transaction itself was committed.
+        #   ddl_batching="statement" commits the transaction and its DDL before
+        #   the next other statement instead, as the test suite's provisioning
+        #   committing every DDL statement did (see provision.py).
+        self.ddl_batching = ddl_batching
+        self._ddl_batches = weakref.WeakKeyDictionary()
+
+        self._cache_names()
+
+    @classmethod
+    def engine_created(cls, engine):
+        event.listen(engine.pool, "reset", engine.dialect._reset_pooled_connection)
+
+    def _reset_pooled_connection(self, dbapi_connection, connection_record, reset_state):
+        # A transaction kept open by COMMIT / ROLLBACK RETAINING would stay
+        #   open as long as the connection is idle in the pool
+        if reset_state.terminate_only or not reset_state.asyncio_safe:
+            return
+        if not dbapi_connection.main_transaction.active:
+            return
+
+        # The rollback of the reset, following this event, isn't retaining
+        self._retaining_transactions.state(dbapi_connection).hard_end = True
+        if reset_state.transaction_was_reset:
+            # Ended by the Connection, the retained transaction has no work
+            self.do_rollback(dbapi_connection)
+
     @classmethod
     def dbapi(cls):
         return interbase_driver
@@ -693,7 +1763,12 @@ class IBDialect(default.DefaultDialect):
             embedded=False
 
             Connector url must supply:
-            interbase://<username>:<password>@<host>:<port>/<database_path>[?charset=UTF8&key=value&key=value...]
+            interbase://<username>:<password>@<host>[:<port>]/<database_path>[?charset=UTF8&key=value&key=value...]
+
+            Without a host the database is attached locally, without TCP,
+            or by the embedded server library with ?embedded=true:
+            interbase://<username>:<password>@/<database_path>[?embedded=true]
+            interbase:////absolute/path/to/database.ib
             ```
 
         :param url:
@@ -705,26 +1780,38 @@ class IBDialect(default.DefaultDialect):
         driver_opts = {}
         driver_opts.update(url.query)
 
+        if 'server_version' in driver_opts:
+            self._set_server_version(driver_opts.pop('server_version'))
+
         try:
-            if 'host' not in opts:
-                raise KeyError('Missing host parameter')
-            if 'port' not in opts:
-                raise KeyError('Missing port parameter')
             if 'database' not in opts:
                 raise KeyError('Missing database path parameter')
+            if 'port' in opts and 'host' not in opts:
+                raise KeyError('Missing host parameter')
         except KeyError as err:
             raise KeyError(
                 "Connector url must supply: "
-                "interbase://<username>:<password>@<host>:<port>/<database_path>[?charset=UTF8&key=value&key=value...]"
+                "interbase://<username>:<password>@[<host>[:<port>]]/<database_path>[?charset=UTF8&key=value&key=value...]"
             ) from err
 
-        driver_opts['host'] = f"{opts.get('host', 'localhost')}/{opts.get('port', 3050)}"
+        if 'host' in opts:
+            driver_opts['host'] = (
+                f"{opts['host']}/{opts['port']}" if 'port' in opts else opts['host']
+            )
+        # Without a host the driver attaches locally. The client library is loaded
+        #   once per process, the first connection decides if it's the embedded one.
+        util.coerce_kw_type(driver_opts, 'embedded', bool)
         driver_opts['database'] = opts.get('database')
         driver_opts['user'] = opts.get('username', 'sysdba')
         driver_opts['password'] = opts.get('password', 'masterkey')
         driver_opts['sql_dialect'] = opts.get('sql_dialect', 3)
         driver_opts['charset'] = opts.get('charset', 'WIN1252').upper()
 
+        # Python codec of the connection charset, used to encode streamed TEXT BLOBs
+        self.python_charset = interbase_driver.ibase.charset_map.get(
+            driver_opts['charset'], driver_opts['charset']
+        )
+
         # Ensure the DSN is correctly formed
         # driver_opts['dsn'] = f"localhost/3051:{driver_opts['database']}"
         # driver_opts.pop('host')
@@ -732,26 +1819,346 @@ class IBDialect(default.DefaultDialect):
 
         return [], driver_opts
 
-    # def _get_server_version_info(self, connection):
-    #     dbapi_connection = (
-    #         connection.connection.dbapi_connection
-    #         if self.using_sqlalchemy2
-    #         else connection.connection
-    #     )
-    #     minor, major = modf(dbapi_connection.engine_version)
-    #     return (int(major), int(minor * 10))
+    def _set_server_version(self, server_version):
+        name = str(server_version).strip().upper()
+        if name in VERSION_NAMES:
+            version_info = VERSION_NAMES[name]
+        else:
+            try:
+                version_info = tuple(int(part) for part in name.split("."))
+            except ValueError:
+                raise exc.ArgumentError(
+                    "server_version must be a version number such as '14.1' "
+                    "or one of %s, got %r"
+                    % (", ".join(VERSION_NAMES), server_version)
+                ) from None
+
+        self._server_version = self.server_version_info = version_info
+        self._set_capabilities()
+
+    def _get_server_version_info(self, connection):
+        if self._server_version is not None:
+            return self._server_version
+
+        # Read by the driver when it attaches, no round trip
+        dbapi_connection = (
+            connection.connection.dbapi_connection
+            if self.using_sqlalchemy2
+            else connection.connection
+        )
+        return tuple(int(part) for part in dbapi_connection.version.split("."))
+
+    def _set_capabilities(self):
+        # Features depending on the server version
+        self.supports_native_boolean = self.server_version_info >= BOOLEAN_VERSION
 
     # def do_terminate(self, dbapi_connection) -> None:
     #     dbapi_connection.terminate()
 
+    def _blob_transaction(self, dbapi_connection):
+        transaction = self._blob_transactions.get(dbapi_connection)
+        if transaction is None:
+            transaction = self._blob_transactions[dbapi_connection] = _BlobTransaction()
+        return transaction
+
+    def _end_blob_transaction(self, dbapi_connection):
+        # BLOB ids are only valid in the transaction that fetched them
+        #   first_connect() passes a proxied connection
+        dbapi_connection = getattr(
+            dbapi_connection, "dbapi_connection", dbapi_connection
+        )
+        transaction = self._blob_transactions.pop(dbapi_connection, None)
+        if transaction is not None:
+            transaction.active = False
+
+    def _statement_cache(self, context):
+        """The _StatementCache of the connection of context, None when not used"""
+        if not self.statement_cache_size or self.is_async or context is None:
+            return None
+
+        info = context._dbapi_connection.info
+        cache = info.get("interbase_statement_cache")
+
+        if context.isddl or _DDL_STATEMENT.match(context.statement):
+            self._ddl_generation += 1
+            if cache is not None:
+                cache.clear()
+            return None
+
+        if cache is None:
+            cache = info["interbase_statement_cache"] = _StatementCache(
+                self.statement_cache_size, self._ddl_generation
+            )
+        elif cache.ddl_generation != self._ddl_generation:
+            cache.clear()
+            cache.ddl_generation = self._ddl_generation
+
+        # Stream BLOB columns are a permanent setting of a prepared statement
+        if getattr(context, "_stream_blob_positions", None):
+            return None
+        return cache
+
+    def _cached_statement_cursor(self, cursor, statement, context):
+        cache = self._statement_cache(context)
+        if cache is None:
+            return None
+
+        cached_cursor = cache.checkout(context._dbapi_connection, statement)
+        if cached_cursor is not None:
+            # The result is read from the cursor of the prepared statement
+            cursor.close()
+            context.cursor = cached_cursor
+        return cached_cursor
+
+    def _batch_ddl(self, statement, context):
+        """True if the DDL statement waits for the next commit, see ddl_batching"""
+        if context is None:
+            return False
+
+        dbapi_connection = getattr(
+            context._dbapi_connection, "dbapi_connection", context._dbapi_connection
+        )
+        batch = self._ddl_batches.get(dbapi_connection)
+        if not context.isddl and not _DDL_STATEMENT.match(statement):
+            # Committing here would also commit the work of the transaction
+            #   before the DDL, the waiting DDL only runs at commit
+            if self.ddl_batching == "statement" and batch is not None and (
+                batch.created or batch.deferred
+            ):
+                self._commit_ddl_batch(dbapi_connection, batch)
+            elif self.ddl_batching and batch is not None and batch.deferred:
+                raise exc.InvalidRequestError(
+                    "DDL of this transaction waits for its commit (ddl_batching), "
+                    "commit before executing other statements"
+                )
+            return False
+
+        element = context.compiled.statement if context.isddl else None
+        autoincrement_ddl = self._autoincrement_ddl(dbapi_connection, element)
+        if not self.ddl_batching and not autoincrement_ddl:
+            return False
+
+        if batch is None:
+            batch = self._ddl_batches[dbapi_connection] = _DDLBatch()
+        waits = False
+        if self.ddl_batching:
+            # Textual DDL is unknown DDL
+            tables = _ddl_tables(element) or (None, set())
+            waits = batch.add(statement, *tables)
+        for ddl in autoincrement_ddl:
+            batch.defer(str(ddl.compile(dialect=self)), {element.element.fullname}, set())
+        return waits
+
+    def _autoincrement_ddl(self, dbapi_connection, element):
+        # The trigger of an autoincrement primary key can only be created
+        #   once its table is committed, the generator once the table is
+        #   dropped. Both wait for the commit, even without ddl_batching.
+        if not isinstance(element, (sa_schema.CreateTable, sa_schema.DropTable)):
+            return ()
+        column = element.element._autoincrement_column
+        if column is None or not _uses_autoincrement_trigger(column):
+            return ()
+
+        generator_name, _ = _autoincrement_names(self, column)
+        if isinstance(element, sa_schema.CreateTable):
+            # The generator is independent of the table, created with it
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute(
+                    str(sa_schema.CreateSequence(sa_schema.Sequence(generator_name)).compile(dialect=self))
+                )
+            finally:
+                cursor.close()
+            return (CreateAutoincrementTrigger(column),)
+
+        # Tables created before the generators were emitted have none
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(
+                "SELECT 1 FROM rdb$generators WHERE rdb$generator_name = ?",
+                (self.denormalize_name(generator_name),),
+            )
+            exists = cursor.fetchone() is not None
+        finally:
+            cursor.close()
+        return (DropAutoincrementGenerator(column),) if exists else ()
+
+    def _commit_ddl_batch(self, dbapi_connection, batch):
+        # Every round commits the tables the waiting DDL depends on. The
+        #   first commit is the one of the transaction, requested by do_commit
+        while True:
+            dbapi_connection.commit()
+            self._retaining_transactions.ended(dbapi_connection, False, True)
+            self._end_blob_transaction(dbapi_connection)
+
+            deferred = batch.deferred
+            batch.created, batch.waiting, batch.barrier, batch.deferred = set(), set(), False, []
+            if not deferred:
+                return
+
+            self._ddl_generation += 1
+            cursor = dbapi_connection.cursor()
+            try:
+                for statement, tables, created in deferred:
+                    if not batch.add(statement, tables, created):
+                        cursor.execute(statement)
+            finally:
+                cursor.close()
+
+    def do_execute(self, cursor, statement, parameters, context=None):
+        if self._batch_ddl(statement, context):
+            # The statement cache is cleared as for any DDL
+            self._statement_cache(context)
+            return
+
+        cached_cursor = self._cached_statement_cursor(cursor, statement, context)
+        if cached_cursor is None:
+            cursor.execute(statement, parameters)
+            return
+
+        try:
+            cached_cursor.execute(statement, parameters)
+        except BaseException:
+            cached_cursor.close()
+            raise
+
+    def do_executemany(self, cursor, statement, parameters, context=None):
+        # The statement is prepared once for all the parameter sets, and the
+        #   row counts of the executions are summed (supports_sane_multi_rowcount)
+        if self._batch_ddl(statement, context):
+            self._statement_cache(context)
+            return
+        if self.is_async:
+            # The asyncio adapter runs execute_prepared_many in its worker thread
+            cursor.executemany(statement, parameters)
+            rowcount = cursor.rowcount
+        else:
+            cached_cursor = self._cached_statement_cursor(cursor, statement, context)
+            if cached_cursor is None:
+                rowcount = execute_prepared_many(cursor, statement, parameters)
+            else:
+                try:
+                    rowcount = execute_prepared_many(cached_cursor, statement, parameters)
+                except BaseException:
+                    cached_cursor.close()
+                    raise
+
+        if context is not None:
+            context._rowcount = rowcount
+
+    def _tpb_options(self, dbapi_connection):
+        # Pool proxies are unwrapped, options belong to the DBAPI connection
+        dbapi_connection = getattr(
+            dbapi_connection, "dbapi_connection", dbapi_connection
+        )
+        options = self._connection_tpb_options.get(dbapi_connection)
+        if options is None:
+            options = self._connection_tpb_options[dbapi_connection] = dict(
+                _DEFAULT_TPB_OPTIONS
+            )
+        return options
+
+    def _set_tpb_option(self, dbapi_connection, option, value):
+        if option == "lock_timeout" and value is not None:
+            # The driver's TPB has no lock timeout, InterBase doesn't support it
+            raise exc.ArgumentError(
+                "interbase_lock_timeout isn't supported by InterBase, use "
+                "interbase_wait=False to fail at once on a lock conflict"
+            )
+
+        options = self._tpb_options(dbapi_connection)
+        options[option] = value
+        # The driver starts its transactions with the TPB of main_transaction
+        transaction = dbapi_connection.main_transaction
+        transaction.default_tpb = _render_tpb(options)
+
+        if transaction.active:
+            # The TPB applies to the next transaction, the work of this one is
+            #   kept. Kept open by COMMIT RETAINING, it ends for real next time.
+            self._retaining_transactions.state(dbapi_connection).hard_end = True
+
+    def get_isolation_level_values(self, dbapi_connection):
+        return list(_ISOLATION_LEVELS)
+
+    def set_isolation_level(self, dbapi_connection, level):
+        self._set_tpb_option(dbapi_connection, "isolation_level", _ISOLATION_LEVELS[level])
+
+    def get_isolation_level(self, dbapi_connection):
+        return self._tpb_options(dbapi_connection)["isolation_level"]
+
+    @property
+    def commit_stats(self):
+        """Numbers of retaining and hard commits and rollbacks of this engine"""
+        return self._retaining_transactions.stats()
+
+    def _end_transaction(self, dbapi_connection, commit):
+        batch = self._ddl_batches.pop(
+            getattr(dbapi_connection, "dbapi_connection", dbapi_connection), None
+        )
+        if commit and batch is not None and batch.deferred:
+            self._commit_ddl_batch(dbapi_connection, batch)
+
+        # Without an active transaction the driver ignores commit() / rollback()
+        active = dbapi_connection.main_transaction.active
+        retaining = active and self._retaining_transactions.retain(dbapi_connection)
+        try:
+            if commit:
+                dbapi_connection.commit(retaining)
+            else:
+                dbapi_connection.rollback(retaining)
+            if active:
+                self._retaining_transactions.ended(dbapi_connection, retaining, commit)
+        finally:
+            # A retained transaction keeps the BLOB handles valid
+            if not retaining:
+                self._end_blob_transaction(dbapi_connection)
+
+    def do_commit(self, dbapi_connection):
+        self._end_transaction(dbapi_connection, True)
+
+    def do_rollback(self, dbapi_connection):
+        self._end_transaction(dbapi_connection, False)
+
+    def do_close(self, dbapi_connection):
+        self._end_blob_transaction(dbapi_connection)
+        dbapi_connection.close()
+
     def initialize(self, connection):
         super().initialize(connection)
 
         self.supports_identity_columns = False
-        self.supports_native_boolean = False
+        self._set_capabilities()
 
         self.max_identifier_length = MAX_IDENTIFIER_LENGTH
         self.preparer.reserved_words = RESERVED_WORDS
+        # The reserved words decide which names are quoted
+        self._cache_names()
+
+    def _cache_names(self):
+        # Reflection normalizes a name in every row of every rdb$ query, the
+        #   caches are shared by the inspectors of the engine
+        self._normalized_names = {}
+        self._denormalized_names = {}
+
+    def normalize_name(self, name):
+        names = self._normalized_names
+        normalized = names.get(name, names)
+        if normalized is names:
+            normalized = super().normalize_name(name)
+            # Full: the names of a catalogue read in a loop would evict each
+            #   other before their next use, the cache is kept as it is
+            if len(names) < NAME_CACHE_SIZE:
+                names[name] = normalized
+        return normalized
+
+    def denormalize_name(self, name):
+        names = self._denormalized_names
+        denormalized = names.get(name, names)
+        if denormalized is names:
+            denormalized = super().denormalize_name(name)
+            if len(names) < NAME_CACHE_SIZE:
+                names[name] = denormalized
+        return denormalized
 
     @reflection.cache
     def has_table(self, connection, table_name, schema=None, **kw):
@@ -848,12 +2255,97 @@ class IBDialect(default.DefaultDialect):
 
         raise exc.NoSuchTableError(view_name)
 
-    @reflection.cache
-    def get_columns(  # noqa: C901
-            self, connection, table_name, schema=None, **kw
+    def _has_identity_columns(self):
+        # is_firebird_25 = self.server_version_info < (3,)
+        # has_identity_columns = not is_firebird_25
+        return False
+
+    @staticmethod
+    def _without_lines(query, marker):
+        # Remove query lines containing marker
+        lines = str.splitlines(query)
+        filtered = filter(lambda x: marker not in x, lines)
+        return "\r\n".join(list(filtered))
+
+    def _get_multi_relation_names(
+            self,
+            connection,
+            schema=None,
+            filter_names=None,
+            scope=None,
+            kind=None,
+            **kw,
     ):
-        columns_query = """
-            SELECT RTRIM(rf.rdb$field_name) AS field_name,
+        # Relations reported by get_multi_* methods, the same ones
+        #   DefaultDialect._default_multi_reflect() would reflect one by one
+        names = []
+        if reflection.ObjectScope.DEFAULT in scope:
+            if reflection.ObjectKind.TABLE in kind:
+                names.extend(self.get_table_names(connection, schema, **kw))
+            if reflection.ObjectKind.VIEW in kind:
+                names.extend(self.get_view_names(connection, schema, **kw))
+        if reflection.ObjectScope.TEMPORARY in scope:
+            if reflection.ObjectKind.TABLE in kind:
+                names.extend(
+                    self.get_temp_table_names(connection, schema, **kw)
+                )
+
+        if filter_names:
+            filter_names = set(filter_names)
+            names = [name for name in names if name in filter_names]
+
+        return names
+
+    def _rows_by_relation(self, result):
+        rows = util.defaultdict(list)
+        for row in result:
+            rows[self.normalize_name(row.relation_name)].append(row)
+
+        return rows
+
+    def _multi_reflect(self, connection, reflected, schema=None, **kw):
+        names = self._get_multi_relation_names(connection, schema, **kw)
+        if not names:
+            return []
+
+        results = self._reflect_all_relations(
+            connection, reflected, info_cache=kw.get("info_cache")
+        )
+        default = getattr(reflection.ReflectionDefaults, reflected)
+        return [
+            ((schema, name), results.get(name) or default()) for name in names
+        ]
+
+    @reflection.cache
+    def _reflect_all_relations(self, connection, reflected, **kw):
+        # One query for all relations instead of one query per relation.
+        #   Queries of the single relation methods filter by relation name
+        #   in lines marked with [relation], these lines are removed here.
+        #   Returns {relation name: reflected value}, reflected is the name
+        #   of the reflected object, e.g. "columns" or "pk_constraint".
+        if reflected == "indexes":
+            return self._indexes_by_relation(connection, **kw)
+
+        query = getattr(self, f"_{reflected}_query")
+        from_rows = getattr(self, f"_{reflected}_from_rows")
+
+        rows = self._rows_by_relation(
+            connection.exec_driver_sql(
+                self._without_lines(query, "[relation]")
+            )
+        )
+        return {
+            name: from_rows(relation_rows)
+            for name, relation_rows in rows.items()
+        }
+
+    @property
+    def _columns_query(self):
+        # The trigger of an autoincrement column has the generated name, cut
+        #   or not, and depends on the column (NEW.<column>)
+        columns_query = f"""
+            SELECT RTRIM(rf.rdb$relation_name) AS relation_name,
+                   RTRIM(rf.rdb$field_name) AS field_name,
                    COALESCE(rf.rdb$null_flag, f.rdb$null_flag) AS null_flag,
                    RTRIM(t.rdb$type_name) AS field_type,
                    f.rdb$field_length / COALESCE(cs.rdb$bytes_per_character, 1) AS field_length,
@@ -865,6 +2357,22 @@ class IBDialect(default.DefaultDialect):
                    RTRIM(cl.rdb$collation_name) as collation_name,
                    COALESCE(rf.rdb$default_source, f.rdb$default_source) AS default_source,
                    RTRIM(rf.rdb$description) AS description,
+                   (SELECT COUNT(*)                                    -- See _autoincrement_stored_names
+                      FROM rdb$triggers tr
+                      JOIN rdb$dependencies d
+                        ON d.rdb$dependent_name = tr.rdb$trigger_name
+                     WHERE tr.rdb$relation_name = rf.rdb$relation_name
+                       AND tr.rdb$trigger_type = 1 -- BEFORE INSERT
+                       AND COALESCE(tr.rdb$trigger_inactive, 0) = 0
+                       AND d.rdb$depended_on_name = rf.rdb$relation_name
+                       AND d.rdb$field_name = rf.rdb$field_name
+                       AND (RTRIM(tr.rdb$trigger_name) =
+                                RTRIM(rf.rdb$relation_name) || '_' || RTRIM(rf.rdb$field_name) || '_TRG'
+                            OR RTRIM(tr.rdb$trigger_name) LIKE
+                                SUBSTRING(RTRIM(rf.rdb$relation_name) || '_' || RTRIM(rf.rdb$field_name)
+                                          FROM 1 FOR {_AUTOINCREMENT_PREFIX_LENGTH})
+                                || '_{"_" * _AUTOINCREMENT_HASH_LENGTH}\\_TRG' ESCAPE '\\')
+                   ) AS autoincrement_triggers,
                    f.rdb$computed_source AS computed_source
                   ,rf.rdb$identity_type AS identity_type,                      -- [fb3+]
                    g.rdb$initial_value AS initial_value,                       -- [fb3+]
@@ -890,28 +2398,25 @@ class IBDialect(default.DefaultDialect):
                         WHERE rdb$index_type = 0 -- Primary index
                     )
             WHERE COALESCE(f.rdb$system_flag, 0) = 0
-              AND rf.rdb$relation_name = LTRIM(RTRIM(?))
-            ORDER BY rf.rdb$field_position
+              AND rf.rdb$relation_name = LTRIM(RTRIM(?))                       -- [relation]
+            ORDER BY rf.rdb$relation_name, rf.rdb$field_position
         """
 
-        # is_firebird_25 = self.server_version_info < (3,)
-        # has_identity_columns = not is_firebird_25
-        # if not has_identity_columns:
-        has_identity_columns = False
-        if not has_identity_columns:
+        if not self._has_identity_columns():
             # Firebird 2.5 doesn't have RDB$GENERATOR_NAME nor RDB$IDENTITY_TYPE in RDB$RELATION_FIELDS
             #   Remove query lines containing [fb3+]
-            lines = str.splitlines(columns_query)
-            filtered = filter(lambda x: "[fb3+]" not in x, lines)
-            columns_query = "\r\n".join(list(filtered))
+            columns_query = self._without_lines(columns_query, "[fb3+]")
 
-        tablename = self.denormalize_name(table_name)
-        c = list(connection.exec_driver_sql(columns_query, (tablename,)))
+        return columns_query
+
+    def _columns_from_rows(self, rows):  # noqa: C901
+        has_identity_columns = self._has_identity_columns()
 
         cols = []
-        for row in c:
+        for row in rows:
             orig_colname = row.field_name
             colname = self.normalize_name(orig_colname)
+            autoincrement_trigger = row.autoincrement_triggers > 0
 
             # Extract data type
 
@@ -1016,17 +2521,25 @@ class IBDialect(default.DefaultDialect):
                         "increment": row.generator_increment,
                     }
 
-                col_d["autoincrement"] = "identity" in col_d
-            else:
+                col_d["autoincrement"] = "identity" in col_d or autoincrement_trigger
+            elif autoincrement_trigger:
                 # For Firebird 2.5 / Interbase
 
                 # A backend is better off not returning "autoincrement" at all,
                 # instead of potentially returning "False" for an auto-incrementing
                 # primary key column. (see test_autoincrement_col)
-                pass
+                col_d["autoincrement"] = True
 
             cols.append(col_d)
 
+        return cols
+
+    @reflection.cache
+    def get_columns(self, connection, table_name, schema=None, **kw):
+        tablename = self.denormalize_name(table_name)
+        c = list(connection.exec_driver_sql(self._columns_query, (tablename,)))
+
+        cols = self._columns_from_rows(c)
         if cols:
             return cols
 
@@ -1039,21 +2552,22 @@ class IBDialect(default.DefaultDialect):
             else []
         )
 
-    @reflection.cache
-    def get_pk_constraint(self, connection, table_name, schema=None, **kw):
-        pk_query = """
-            SELECT LTRIM(RTRIM(rc.rdb$constraint_name)) AS cname, LTRIM(RTRIM(se.rdb$field_name)) AS fname
-            FROM rdb$relation_constraints rc
-                 JOIN rdb$index_segments se
-                   ON se.rdb$index_name = rc.rdb$index_name
-            WHERE rc.rdb$constraint_type = 'PRIMARY KEY'
-              AND rc.rdb$relation_name = LTRIM(RTRIM(?))
-            ORDER BY se.rdb$field_position
-        """
-        tablename = self.denormalize_name(table_name)
-        c = connection.exec_driver_sql(pk_query, (tablename,))
+    def get_multi_columns(self, connection, **kw):
+        return self._multi_reflect(connection, "columns", **kw)
+
+    _pk_constraint_query = """
+        SELECT LTRIM(RTRIM(rc.rdb$relation_name)) AS relation_name,
+               LTRIM(RTRIM(rc.rdb$constraint_name)) AS cname,
+               LTRIM(RTRIM(se.rdb$field_name)) AS fname
+        FROM rdb$relation_constraints rc
+             JOIN rdb$index_segments se
+               ON se.rdb$index_name = rc.rdb$index_name
+        WHERE rc.rdb$constraint_type = 'PRIMARY KEY'
+          AND rc.rdb$relation_name = LTRIM(RTRIM(?))                           -- [relation]
+        ORDER BY rc.rdb$relation_name, se.rdb$field_position
+    """
 
-        rows = c.fetchall()
+    def _pk_constraint_from_rows(self, rows):
         pkfields = (
             [self.normalize_name(r.fname) for r in rows] if rows else None
         )
@@ -1063,6 +2577,17 @@ class IBDialect(default.DefaultDialect):
                 "name": self.normalize_name(rows[0].cname) if rows else None,
             }
 
+        return None
+
+    @reflection.cache
+    def get_pk_constraint(self, connection, table_name, schema=None, **kw):
+        tablename = self.denormalize_name(table_name)
+        c = connection.exec_driver_sql(self._pk_constraint_query, (tablename,))
+
+        pk_constraint = self._pk_constraint_from_rows(c.fetchall())
+        if pk_constraint:
+            return pk_constraint
+
         if not self.has_table(connection, table_name, schema):
             raise exc.NoSuchTableError(table_name)
 
@@ -1072,34 +2597,35 @@ class IBDialect(default.DefaultDialect):
             else {"constrained_columns": [], "name": None}
         )
 
-    @reflection.cache
-    def get_foreign_keys(self, connection, table_name, schema=None, **kw):
-        fk_query = """
-            SELECT LTRIM(RTRIM(rc.rdb$constraint_name)) AS cname,
-                   LTRIM(RTRIM(cse.rdb$field_name)) AS fname,
-                   LTRIM(RTRIM(ix2.rdb$relation_name)) AS targetrname,
-                   LTRIM(RTRIM(se.rdb$field_name)) AS targetfname,
-                   LTRIM(RTRIM(rfc.rdb$update_rule)) AS update_rule,
-                   LTRIM(RTRIM(rfc.rdb$delete_rule)) AS delete_rule
-            FROM rdb$relation_constraints rc
-                 JOIN rdb$ref_constraints rfc 
-                   ON rfc.rdb$constraint_name = rc.rdb$constraint_name
-                 JOIN rdb$indices ix1 
-                   ON ix1.rdb$index_name = rc.rdb$index_name
-                 JOIN rdb$indices ix2 
-                   ON ix2.rdb$index_name = ix1.rdb$foreign_key
-                 JOIN rdb$index_segments cse 
-                   ON cse.rdb$index_name = ix1.rdb$index_name
-                 JOIN rdb$index_segments se 
-                   ON se.rdb$index_name = ix2.rdb$index_name
-                  AND se.rdb$field_position = cse.rdb$field_position
-            WHERE rc.rdb$constraint_type = 'FOREIGN KEY'
-              AND rc.rdb$relation_name = LTRIM(RTRIM(?))
-            ORDER BY rc.rdb$constraint_name, se.rdb$field_position
-        """
-        tablename = self.denormalize_name(table_name)
-        c = connection.exec_driver_sql(fk_query, (tablename,))
+    def get_multi_pk_constraint(self, connection, **kw):
+        return self._multi_reflect(connection, "pk_constraint", **kw)
+
+    _foreign_keys_query = """
+        SELECT LTRIM(RTRIM(rc.rdb$relation_name)) AS relation_name,
+               LTRIM(RTRIM(rc.rdb$constraint_name)) AS cname,
+               LTRIM(RTRIM(cse.rdb$field_name)) AS fname,
+               LTRIM(RTRIM(ix2.rdb$relation_name)) AS targetrname,
+               LTRIM(RTRIM(se.rdb$field_name)) AS targetfname,
+               LTRIM(RTRIM(rfc.rdb$update_rule)) AS update_rule,
+               LTRIM(RTRIM(rfc.rdb$delete_rule)) AS delete_rule
+        FROM rdb$relation_constraints rc
+             JOIN rdb$ref_constraints rfc 
+               ON rfc.rdb$constraint_name = rc.rdb$constraint_name
+             JOIN rdb$indices ix1 
+               ON ix1.rdb$index_name = rc.rdb$index_name
+             JOIN rdb$indices ix2 
+               ON ix2.rdb$index_name = ix1.rdb$foreign_key
+             JOIN rdb$index_segments cse 
+               ON cse.rdb$index_name = ix1.rdb$index_name
+             JOIN rdb$index_segments se 
+               ON se.rdb$index_name = ix2.rdb$index_name
+              AND se.rdb$field_position = cse.rdb$field_position
+        WHERE rc.rdb$constraint_type = 'FOREIGN KEY'
+          AND rc.rdb$relation_name = LTRIM(RTRIM(?))                           -- [relation]
+        ORDER BY rc.rdb$relation_name, rc.rdb$constraint_name, se.rdb$field_position
+    """
 
+    def _foreign_keys_from_rows(self, rows):
         fks = util.defaultdict(
             lambda: {
                 "name": None,
@@ -1111,7 +2637,7 @@ class IBDialect(default.DefaultDialect):
             }
         )
 
-        for row in c:
+        for row in rows:
             cname = self.normalize_name(row.cname)
             fk = fks[cname]
             if not fk["name"]:
@@ -1124,7 +2650,14 @@ class IBDialect(default.DefaultDialect):
             if row.delete_rule not in ["NO ACTION", "RESTRICT"]:
                 fk["options"]["ondelete"] = row.delete_rule
 
-        result = list(fks.values())
+        return list(fks.values())
+
+    @reflection.cache
+    def get_foreign_keys(self, connection, table_name, schema=None, **kw):
+        tablename = self.denormalize_name(table_name)
+        c = connection.exec_driver_sql(self._foreign_keys_query, (tablename,))
+
+        result = self._foreign_keys_from_rows(c)
         if result:
             return result
 
@@ -1137,42 +2670,39 @@ class IBDialect(default.DefaultDialect):
             else []
         )
 
-    @reflection.cache
-    def get_indexes(self, connection, table_name, schema=None, **kw):
-        # condition_source_expr = """
-        #     LTRIM(RTRIM(SUBSTR(ix.rdb$condition_source, 6, STRLEN(ix.rdb$condition_source)) - 5))
-        # """
-
-        indexes_query = f"""
-            SELECT 
-                LTRIM(RTRIM(ix.rdb$index_name)) AS index_name,
-                ix.rdb$unique_flag AS unique_flag,
-                ix.rdb$index_type AS descending_flag,
-                LTRIM(RTRIM(ic.rdb$field_name)) AS field_name,
-                LTRIM(RTRIM(ix.rdb$expression_source)) AS expression_source,
-                CAST(NULL AS VARCHAR(255)) AS condition_source -- Use VARCHAR(255) instead of BLOB SUB_TYPE TEXT
-            FROM 
-                rdb$indices ix
-                LEFT OUTER JOIN rdb$index_segments ic ON ic.rdb$index_name = ix.rdb$index_name
-                LEFT OUTER JOIN rdb$relation_constraints rc ON rc.rdb$index_name = ix.rdb$index_name
-            WHERE 
-                ix.rdb$relation_name = LTRIM(RTRIM('SAMPLE_TABLE'))
-                AND ix.rdb$foreign_key IS NULL
-                AND (rc.rdb$constraint_type IS NULL OR rc.rdb$constraint_type <> 'PRIMARY KEY')
-            ORDER BY 
-                ix.rdb$index_name, ic.rdb$field_position;
-        """
-
-        tablename = self.denormalize_name(table_name)
-
-        # Do not use connection.exec_driver_sql() here.
-        #    During tests we need to commit CREATE INDEX before this query. See provision.py listener.
-        c = connection.execute(
-            text(indexes_query), {"relation_name": tablename}
-        )
+    def get_multi_foreign_keys(self, connection, **kw):
+        return self._multi_reflect(connection, "foreign_keys", **kw)
+
+    # condition_source_expr = """
+    #     LTRIM(RTRIM(SUBSTR(ix.rdb$condition_source, 6, STRLEN(ix.rdb$condition_source)) - 5))
+    # """
+
+    _indexes_query = """
+        SELECT 
+            LTRIM(RTRIM(ix.rdb$relation_name)) AS relation_name,
+            LTRIM(RTRIM(ix.rdb$index_name)) AS index_name,
+            ix.rdb$unique_flag AS unique_flag,
+            ix.rdb$index_type AS descending_flag,
+            ix.rdb$index_inactive AS inactive_flag,
+            ix.rdb$statistics AS statistics,
+            LTRIM(RTRIM(ic.rdb$field_name)) AS field_name,
+            LTRIM(RTRIM(ix.rdb$expression_source)) AS expression_source,
+            CAST(NULL AS VARCHAR(255)) AS condition_source -- Use VARCHAR(255) instead of BLOB SUB_TYPE TEXT
+        FROM 
+            rdb$indices ix
+            LEFT OUTER JOIN rdb$index_segments ic ON ic.rdb$index_name = ix.rdb$index_name
+            LEFT OUTER JOIN rdb$relation_constraints rc ON rc.rdb$index_name = ix.rdb$index_name
+        WHERE 
+            ix.rdb$foreign_key IS NULL
+            AND (rc.rdb$constraint_type IS NULL OR rc.rdb$constraint_type <> 'PRIMARY KEY')
+            AND ix.rdb$relation_name = LTRIM(RTRIM(?))                         -- [relation]
+        ORDER BY 
+            ix.rdb$relation_name, ix.rdb$index_name, ic.rdb$field_position
+    """
 
+    def _indexes_from_rows(self, rows, get_column_set):
         indexes = util.defaultdict(dict)
-        for row in c:
+        for row in rows:
             indexrec = indexes[row.index_name]
             if "name" not in indexrec:
                 indexrec["name"] = self.normalize_name(row.index_name)
@@ -1184,40 +2714,49 @@ class IBDialect(default.DefaultDialect):
                            ]  # Remove outermost parenthesis added by Firebird
                     indexrec["expressions"] = expr.split(EXPRESSION_SEPARATOR)
                 indexrec["dialect_options"] = {
-                    "firebird_descending": bool(row.descending_flag),
-                    "firebird_where": row.condition_source,
+                    "interbase_descending": bool(row.descending_flag),
+                    "interbase_where": row.condition_source,
+                    # Selectivity as of the last SET STATISTICS, 1 / distinct keys
+                    "interbase_statistics": row.statistics,
+                    "interbase_inactive": bool(row.inactive_flag),
                 }
 
-            indexrec["column_names"].append(
-                self.normalize_name(row.field_name)
-            )
+            if row.field_name is not None:
+                indexrec["column_names"].append(
+                    self.normalize_name(row.field_name)
+                )
 
-        def _get_column_set(tablename):
-            colqry = """
-                    SELECT LTRIM(RTRIM(r.rdb$field_name)) AS fname
-                    FROM rdb$relation_fields r
-                    WHERE r.rdb$relation_name = LTRIM(RTRIM(?))
-                """
-            return {
-                self.normalize_name(row.fname)
-                for row in connection.exec_driver_sql(colqry, (tablename,))
-            }
+        result = list(indexes.values())
 
-        def _adjust_column_names_for_expressions(result, tablename):
-            # Identify which expression elements are columns
-            colset = _get_column_set(tablename)
+        # Identify which expression elements are columns
+        if any(i.get("expressions") is not None for i in result):
+            colset = get_column_set()
             for i in result:
                 expr = i.get("expressions")
                 if expr is not None:
                     i["column_names"] = [
-                        x if self.normalize_name(x) in colset else None
+                        self.normalize_name(x) if self.normalize_name(x) in colset else None
                         for x in expr
                     ]
-            return result
 
-        result = list(indexes.values())
+        return result
+
+    @reflection.cache
+    def get_indexes(self, connection, table_name, schema=None, **kw):
+        tablename = self.denormalize_name(table_name)
+
+        c = connection.exec_driver_sql(self._indexes_query, (tablename,))
+
+        def _get_column_set():
+            # Usually already reflected, from the info_cache
+            return {
+                col["name"]
+                for col in self.get_columns(connection, table_name, schema, **kw)
+            }
+
+        result = self._indexes_from_rows(c, _get_column_set)
         if result:
-            return _adjust_column_names_for_expressions(result, tablename)
+            return result
 
         if not self.has_table(connection, table_name, schema):
             raise exc.NoSuchTableError(table_name)
@@ -1228,36 +2767,63 @@ class IBDialect(default.DefaultDialect):
             else []
         )
 
-    @reflection.cache
-    def get_unique_constraints(
-            self, connection, table_name, schema=None, **kw
-    ):
-        unique_constraints_query = """
-            SELECT LTRIM(RTRIM(rc.rdb$constraint_name)) AS cname,
-                   LTRIM(RTRIM(se.rdb$field_name)) AS column_name
-            FROM rdb$index_segments se
-                 JOIN rdb$relation_constraints rc
-                   ON rc.rdb$index_name = se.rdb$index_name
-                 JOIN rdb$relations r
-                   ON r.rdb$relation_name = rc.rdb$relation_name
-                  AND COALESCE(r.rdb$system_flag, 0) = 0
-            WHERE rc.rdb$constraint_type = 'UNIQUE'
-              AND r.rdb$relation_name = LTRIM(RTRIM(?))
-            ORDER BY rc.rdb$constraint_name, se.rdb$field_position
-        """
-        tablename = self.denormalize_name(table_name)
-        c = connection.exec_driver_sql(unique_constraints_query, (tablename,))
+    def _indexes_by_relation(self, connection, **kw):
+        rows = self._rows_by_relation(
+            connection.exec_driver_sql(
+                self._without_lines(self._indexes_query, "[relation]")
+            )
+        )
+
+        def _get_column_set(name):
+            # The columns of every relation, usually already reflected
+            columns = self._reflect_all_relations(connection, "columns", **kw)
+            return {col["name"] for col in columns.get(name, ())}
+
+        return {
+            name: self._indexes_from_rows(
+                relation_rows, lambda: _get_column_set(name)
+            )
+            for name, relation_rows in rows.items()
+        }
+
+    def get_multi_indexes(self, connection, **kw):
+        return self._multi_reflect(connection, "indexes", **kw)
+
+    _unique_constraints_query = """
+        SELECT LTRIM(RTRIM(rc.rdb$relation_name)) AS relation_name,
+               LTRIM(RTRIM(rc.rdb$constraint_name)) AS cname,
+               LTRIM(RTRIM(se.rdb$field_name)) AS column_name
+        FROM rdb$index_segments se
+             JOIN rdb$relation_constraints rc
+               ON rc.rdb$index_name = se.rdb$index_name
+             JOIN rdb$relations r
+               ON r.rdb$relation_name = rc.rdb$relation_name
+              AND COALESCE(r.rdb$system_flag, 0) = 0
+        WHERE rc.rdb$constraint_type = 'UNIQUE'
+          AND r.rdb$relation_name = LTRIM(RTRIM(?))                            -- [relation]
+        ORDER BY rc.rdb$relation_name, rc.rdb$constraint_name, se.rdb$field_position
+    """
 
+    def _unique_constraints_from_rows(self, rows):
         ucs = util.defaultdict(lambda: {"name": None, "column_names": []})
 
-        for row in c:
+        for row in rows:
             cname = self.normalize_name(row.cname)
             cc = ucs[cname]
             if not cc["name"]:
                 cc["name"] = cname
             cc["column_names"].append(self.normalize_name(row.column_name))
 
-        result = list(ucs.values())
+        return list(ucs.values())
+
+    @reflection.cache
+    def get_unique_constraints(
+            self, connection, table_name, schema=None, **kw
+    ):
+        tablename = self.denormalize_name(table_name)
+        c = connection.exec_driver_sql(self._unique_constraints_query, (tablename,))
+
+        result = self._unique_constraints_from_rows(c)
         if result:
             return result
 
@@ -1270,38 +2836,48 @@ class IBDialect(default.DefaultDialect):
             else []
         )
 
+    def get_multi_unique_constraints(self, connection, **kw):
+        return self._multi_reflect(connection, "unique_constraints", **kw)
+
+    _table_comment_query = """
+        SELECT LTRIM(RTRIM(rdb$relation_name)) AS relation_name,
+               LTRIM(RTRIM(rdb$description)) AS comment
+        FROM rdb$relations
+        WHERE rdb$relation_name = LTRIM(RTRIM(?))                              -- [relation]
+    """
+
+    @staticmethod
+    def _table_comment_from_rows(rows):
+        return {"text": rows[0].comment} if rows else None
+
     @reflection.cache
     def get_table_comment(self, connection, table_name, schema=None, **kw):
-        table_comment_query = """
-            SELECT LTRIM(RTRIM(rdb$description)) AS comment
-            FROM rdb$relations
-            WHERE rdb$relation_name = LTRIM(RTRIM(?))
-        """
         tablename = self.denormalize_name(table_name)
-        c = connection.exec_driver_sql(table_comment_query, (tablename,))
+        c = connection.exec_driver_sql(self._table_comment_query, (tablename,))
 
         row = c.fetchone()
         if row:
-            return {"text": row[0]}
+            return {"text": row.comment}
 
         raise exc.NoSuchTableError(table_name)
 
-    @reflection.cache
-    def get_check_constraints(self, connection, table_name, schema=None, **kw):
-        check_constraints_query = """
-            SELECT LTRIM(RTRIM(rc.rdb$constraint_name)) AS cname,
-                   SUBSTR(tr.rdb$trigger_source, 8, STRLEN(tr.rdb$trigger_source) - 7) AS sqltext
-            FROM rdb$relation_constraints rc
-                 JOIN rdb$check_constraints ck ON ck.rdb$constraint_name = rc.rdb$constraint_name
-                 JOIN rdb$triggers tr ON tr.rdb$trigger_name = ck.rdb$trigger_name
-            WHERE rc.rdb$constraint_type = 'CHECK'
-                  AND rc.rdb$relation_name = LTRIM(RTRIM(?))
-                  AND tr.rdb$trigger_type = 1
-            ORDER BY 1
-        """
-        tablename = self.denormalize_name(table_name)
-        c = connection.exec_driver_sql(check_constraints_query, (tablename,))
+    def get_multi_table_comment(self, connection, **kw):
+        return self._multi_reflect(connection, "table_comment", **kw)
+
+    _check_constraints_query = """
+        SELECT LTRIM(RTRIM(rc.rdb$relation_name)) AS relation_name,
+               LTRIM(RTRIM(rc.rdb$constraint_name)) AS cname,
+               SUBSTR(tr.rdb$trigger_source, 8, STRLEN(tr.rdb$trigger_source) - 7) AS sqltext
+        FROM rdb$relation_constraints rc
+             JOIN rdb$check_constraints ck ON ck.rdb$constraint_name = rc.rdb$constraint_name
+             JOIN rdb$triggers tr ON tr.rdb$trigger_name = ck.rdb$trigger_name
+        WHERE rc.rdb$constraint_type = 'CHECK'
+              AND rc.rdb$relation_name = LTRIM(RTRIM(?))                       -- [relation]
+              AND tr.rdb$trigger_type = 1
+        ORDER BY 1, 2
+    """
 
+    def _check_constraints_from_rows(self, rows):
         ccs = util.defaultdict(
             lambda: {
                 "name": None,
@@ -1309,14 +2885,21 @@ class IBDialect(default.DefaultDialect):
             }
         )
 
-        for row in c:
+        for row in rows:
             cname = self.normalize_name(row.cname)
             cc = ccs[cname]
             if not cc["name"]:
                 cc["name"] = cname
                 cc["sqltext"] = row.sqltext
 
-        result = list(ccs.values())
+        return list(ccs.values())
+
+    @reflection.cache
+    def get_check_constraints(self, connection, table_name, schema=None, **kw):
+        tablename = self.denormalize_name(table_name)
+        c = connection.exec_driver_sql(self._check_constraints_query, (tablename,))
+
+        result = self._check_constraints_from_rows(c)
         if result:
             return result
 
@@ -1329,6 +2912,9 @@ class IBDialect(default.DefaultDialect):
             else []
         )
 
+    def get_multi_check_constraints(self, connection, **kw):
+        return self._multi_reflect(connection, "check_constraints", **kw)
+
     @reflection.cache
     def _load_domains(self, connection, schema=None, **kw):
         domains_query = """
@@ -1354,19 +2940,40 @@ class IBDialect(default.DefaultDialect):
             for row in result.mappings()
         ]
 
+    def do_ping(self, dbapi_connection):
+        # A single isc_database_info() round trip, nothing is prepared or executed
+        dbapi_connection.database_info(interbase_driver.isc_info_attachment_id, "i")
+        return True
+
     def is_disconnect(self, e, connection, cursor):
-        is_ib = self.driver == "interbase"
+        if isinstance(e, self.dbapi.ProgrammingError) and "detached from database" in str(e):
+            # The driver's connection was closed
+            return True
+
         if isinstance(e, self.dbapi.DatabaseError):
-            sqlcode = e.args[1] if is_ib else e.sqlcode
-            gdscode = e.args[2] if is_ib else e.gds_codes[0]
-            return sqlcode == -902 and gdscode in (
-                335544726,  # net_read_err     Error reading data from the connection
-                335544727,  # net_write_err    Error writing data to the connection
-                335544721,  # network_error    Unable to complete network request to host "@1"
-                335544856,  # att_shutdown     Connection shutdown
-            )
+            # DatabaseError(message, sqlcode, gdscode)
+            return len(e.args) > 2 and e.args[2] in _DISCONNECT_GDSCODES
 
         return False
 
 
 dialect = IBDialect
+
+
+def in_list_table(metadata):
+    """Define the global temporary table of the long IN lists in metadata.
+
+    IN lists longer than the in_list_temp_table_threshold dialect argument are
+    loaded in this table, create it once per database with metadata.create_all().
+    """
+    return sa_schema.Table(
+        IN_LIST_TABLE.lower(),
+        metadata,
+        sa_schema.Column("list_id", sa_types.BigInteger, nullable=False),
+        sa_schema.Column("int_value", sa_types.BigInteger),
+        sa_schema.Column("str_value", sa_types.String(IN_LIST_STR_LENGTH)),
+        sa_schema.Index("sqla_in_list_int", "list_id", "int_value"),
+        sa_schema.Index("sqla_in_list_str", "list_id", "str_value"),
+        prefixes=["GLOBAL TEMPORARY"],
+        interbase_on_commit="DELETE ROWS",
+    )
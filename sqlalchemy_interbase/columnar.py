@@ -0,0 +1,155 @@
+"""Columnar fetching of results into NumPy arrays or Arrow record batches
+
+    result = connection.execute(select(table), execution_options={"stream_results": True})
+    arrays = columns_as_arrays(result)              # {"ID": int64 array, ...}
+
+    for batch in columns_as_record_batches(result):  # pyarrow.RecordBatch
+        ...
+
+Rows are fetched in batches of batch_size and the raw driver values are
+converted column by column, the result processors of the column types and
+the Row objects are skipped. Integer columns become int64, float columns
+float64, TIMESTAMP datetime64[us] and DATE datetime64[D]; other columns keep
+the driver values (object arrays, inferred Arrow types), INT128 and fixed
+point NUMERIC / DECIMAL too since int64 and float64 would lose their range
+or precision.
+
+NumPy and pyarrow are optional, they are imported on first use.
+"""
+
+import datetime as dt
+
+from sqlalchemy import types as sqltypes
+
+from sqlalchemy_interbase import types as ib_types
+
+DEFAULT_BATCH_SIZE = 10000
+
+_NUMPY_DTYPES = {
+    "int64": "int64",
+    "float64": "float64",
+    "timestamp": "datetime64[us]",
+    "date": "datetime64[D]",
+}
+
+# Python type of the driver's cursor.description type_code, for textual statements
+_TYPE_CODES = {
+    int: "int64",
+    float: "float64",
+    dt.datetime: "timestamp",
+    dt.date: "date",
+}
+
+
+def _column_kinds(result):
+    compiled = result.context.compiled
+    result_columns = getattr(compiled, "_result_columns", None) or ()
+    dialect = result.context.dialect
+
+    kinds = []
+    for position, column in enumerate(result.cursor.description):
+        if position < len(result_columns):
+            type_ = result_columns[position].type
+            # IBINT128 would be adapted to IBINTEGER by the colspecs of the dialect
+            if not isinstance(type_, ib_types.IBINT128):
+                type_ = type_.dialect_impl(dialect)
+            if isinstance(type_, ib_types.IBINT128):
+                kinds.append(None)
+            elif isinstance(type_, sqltypes.Integer):
+                kinds.append("int64")
+            elif isinstance(type_, sqltypes.Float):
+                kinds.append("float64")
+            elif isinstance(type_, sqltypes.DateTime):
+                kinds.append("timestamp")
+            elif isinstance(type_, sqltypes.Date):
+                kinds.append("date")
+            elif isinstance(type_, sqltypes.NullType):
+                kinds.append(_description_kind(column))
+            else:
+                # Numeric, Decimal values
+                kinds.append(None)
+        else:
+            kinds.append(_description_kind(column))
+    return kinds
+
+
+def _description_kind(column):
+    kind = _TYPE_CODES.get(column[1])
+    # INT128 values are int too, their internal_size is 16
+    if kind == "int64" and (column[3] or 0) > 8:
+        return None
+    return kind
+
+
+def _batches(result, batch_size):
+    # Raw rows, before the result processors
+    while True:
+        rows = result.cursor_strategy.fetchmany(result, result.cursor, batch_size)
+        if not rows:
+            return
+        yield list(zip(*rows))
+
+
+def _numpy_array(numpy, values, kind):
+    dtype = _NUMPY_DTYPES.get(kind)
+    if dtype is None:
+        array = numpy.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+
+    if kind == "int64" and None in values:
+        # int64 has no NULL, keep the values in a masked array
+        mask = [value is None for value in values]
+        return numpy.ma.masked_array(
+            numpy.array([0 if value is None else value for value in values], dtype=dtype),
+            mask=mask,
+        )
+
+    # None is converted to nan / NaT
+    return numpy.array(values, dtype=dtype)
+
+
+def columns_as_arrays(result, batch_size=DEFAULT_BATCH_SIZE):
+    """Fetch the remaining rows of result as a dict of NumPy arrays per column"""
+    import numpy
+
+    names = list(result.keys())
+    kinds = _column_kinds(result)
+    chunks = [[] for _ in names]
+
+    for columns in _batches(result, batch_size):
+        for position, values in enumerate(columns):
+            chunks[position].append(_numpy_array(numpy, values, kinds[position]))
+
+    arrays = {}
+    for name, kind, column_chunks in zip(names, kinds, chunks):
+        if not column_chunks:
+            arrays[name] = numpy.empty(0, dtype=_NUMPY_DTYPES.get(kind, object))
+        elif any(isinstance(chunk, numpy.ma.MaskedArray) for chunk in column_chunks):
+            arrays[name] = numpy.ma.concatenate(column_chunks)
+        else:
+            arrays[name] = numpy.concatenate(column_chunks)
+    return arrays
+
+
+def columns_as_record_batches(result, batch_size=DEFAULT_BATCH_SIZE):
+    """Fetch the remaining rows of result as pyarrow.RecordBatch, one per batch"""
+    import pyarrow
+
+    arrow_types = {
+        "int64": pyarrow.int64(),
+        "float64": pyarrow.float64(),
+        "timestamp": pyarrow.timestamp("us"),
+        "date": pyarrow.date32(),
+    }
+    names = list(result.keys())
+    types = [arrow_types.get(kind) for kind in _column_kinds(result)]
+
+    for columns in _batches(result, batch_size):
+        yield pyarrow.RecordBatch.from_arrays(
+            [
+                pyarrow.array(values, type=type_)
+                for values, type_ in zip(columns, types)
+            ],
+            names=names,
+        )
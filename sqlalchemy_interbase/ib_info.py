@@ -1,6 +1,11 @@
 """Interbase specific information
     Variables:
         MAX_IDENTIFIER_LENGTH -> int
+        MAX_STATEMENT_LENGTH -> int
+        MAX_MESSAGE_LENGTH -> int
+        MAX_CONTEXTS -> int
+        MAX_IN_LIST_ITEMS -> int
+        VERSION_NAMES -> dict
         RESERVED_WORDS -> set
 """
 
@@ -8,6 +13,33 @@
 # "Length cannot exceed 31 characters."
 MAX_IDENTIFIER_LENGTH = 31
 
+# https://docwiki.embarcadero.com/InterBase/2020/en/Specifications
+# Maximum length of the SQL text of a single DSQL statement
+MAX_STATEMENT_LENGTH = 65535
+
+# Maximum size of the input / output message (all parameters of one statement)
+MAX_MESSAGE_LENGTH = 65535
+
+# Maximum number of relation contexts (tables, views, rdb$database...) per statement
+MAX_CONTEXTS = 255
+
+# Maximum number of items of an IN (...) list
+MAX_IN_LIST_ITEMS = 1500
+
+# Product names of the server versions, for the server_version dialect argument
+VERSION_NAMES = {
+    '2007': (8,),
+    '2009': (9,),
+    'XE': (10,),
+    'XE3': (11,),
+    'XE7': (12,),
+    '2017': (13,),
+    '2020': (14,),
+}
+
+# First server version with the BOOLEAN data type
+BOOLEAN_VERSION = (7,)
+
 # https://docwiki.embarcadero.com/InterBase/2020/en/InterBase_Keywords
 # This set is for Interbase 2020
 RESERVED_WORDS = {
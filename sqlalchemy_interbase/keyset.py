@@ -0,0 +1,114 @@
+"""Keyset ("seek") pagination of ORDER BY statements
+
+    statement = select(table).order_by(table.c.created, table.c.id)
+
+    page = connection.execute(keyset_page(statement, 100, last_key=(created, id))).all()
+
+    for rows in keyset_pages(connection, statement, page_size=1000):
+        ...
+
+OFFSET n is rendered as ROWS n + 1 TO n + m, the server reads and discards
+the first n rows of every page. A keyset page starts after the ORDER BY
+values of the last row of the previous page instead:
+
+    WHERE created >= ? AND (created > ? OR created = ? AND id > ?)
+    ORDER BY created, id ROWS 1 TO 100
+
+With an index on the ORDER BY columns every page costs the same. The ORDER
+BY columns must be NOT NULL, identify a row (end them with the primary key)
+and be in the select list for keyset_pages() to read the last key.
+"""
+
+from sqlalchemy import and_
+from sqlalchemy import exc
+from sqlalchemy import or_
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
+
+DEFAULT_PAGE_SIZE = 1000
+
+
+def _order_keys(statement):
+    # [(ORDER BY expression, descending)]
+    keys = []
+    for clause in statement._order_by_clauses:
+        descending = False
+        if isinstance(clause, UnaryExpression) and clause.modifier is not None:
+            if clause.modifier not in (operators.asc_op, operators.desc_op):
+                raise exc.ArgumentError(
+                    "Keyset pagination doesn't support NULLS FIRST / NULLS LAST"
+                )
+            descending = clause.modifier is operators.desc_op
+            clause = clause.element
+        keys.append((clause, descending))
+
+    if not keys:
+        raise exc.ArgumentError("Keyset pagination requires an ORDER BY")
+    if statement._offset_clause is not None:
+        raise exc.ArgumentError("Keyset pagination replaces OFFSET, remove it")
+    return keys
+
+
+def _after(keys, last_key):
+    if len(last_key) != len(keys):
+        raise exc.ArgumentError(
+            "last_key has %d values, the ORDER BY has %d expressions"
+            % (len(last_key), len(keys))
+        )
+
+    # Interbase has no row value comparison (a, b) > (?, ?), it's expanded to
+    #   a > ? OR a = ? AND b > ?
+    alternatives = []
+    for position, (expression, descending) in enumerate(keys):
+        value = last_key[position]
+        alternatives.append(
+            and_(
+                *[
+                    previous == previous_value
+                    for (previous, _), previous_value in zip(keys[:position], last_key)
+                ],
+                expression < value if descending else expression > value,
+            )
+        )
+
+    if len(keys) == 1:
+        return alternatives[0]
+
+    # The leading range lets the optimizer use an index on the first key
+    first, descending = keys[0]
+    first_range = first <= last_key[0] if descending else first >= last_key[0]
+    return and_(first_range, or_(*alternatives))
+
+
+def keyset_page(statement, page_size=DEFAULT_PAGE_SIZE, last_key=None):
+    """The page of statement after the row whose ORDER BY values are last_key.
+
+    The first page is returned when last_key is None.
+    """
+    keys = _order_keys(statement)
+    if last_key is not None:
+        statement = statement.where(_after(keys, last_key))
+    return statement.limit(page_size)
+
+
+def keyset_pages(connection, statement, page_size=DEFAULT_PAGE_SIZE, last_key=None):
+    """Execute statement page by page, yield the rows of every page.
+
+    Pages after the first one share a single compiled (and prepared) statement.
+    """
+    keys = _order_keys(statement)
+    while True:
+        rows = connection.execute(keyset_page(statement, page_size, last_key)).all()
+        if rows:
+            yield rows
+        if len(rows) < page_size:
+            return
+
+        mapping = rows[-1]._mapping
+        try:
+            last_key = tuple(mapping[expression] for expression, _ in keys)
+        except KeyError as err:
+            raise exc.InvalidRequestError(
+                "The ORDER BY expressions must be in the select list of a "
+                "keyset paginated statement"
+            ) from err
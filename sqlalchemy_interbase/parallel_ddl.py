@@ -0,0 +1,215 @@
+"""Parallel metadata.create_all() / drop_all() over several attachments
+
+    create_all(engine, metadata, workers=8)
+    drop_all(engine, metadata, workers=8)
+
+Every table is created in its own transaction on a worker connection, as
+soon as the tables its foreign keys refer to are committed. The indexes of
+a table are then built in parallel, each in its own transaction. Foreign
+keys of dependency cycles (use_alter) are added once all the tables exist.
+Tables are dropped the other way round, once the tables referring to them
+are gone. Unnamed foreign keys of a dependency cycle can't be dropped, a
+warning is emitted and the tables of the cycle are dropped in any order.
+
+The pool of the engine should allow workers + 1 connections. The metadata
+events (before_create, after_drop, ...) and the generators run on the
+additional connection, before and after the tables.
+"""
+
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+from sqlalchemy import exc
+from sqlalchemy import util
+from sqlalchemy.sql.ddl import SchemaDropper
+from sqlalchemy.sql.ddl import SchemaGenerator
+from sqlalchemy.sql.ddl import sort_tables_and_constraints
+
+DEFAULT_WORKERS = 4
+
+
+class _TableGenerator(SchemaGenerator):
+    """Creates a table, its indexes are collected for the workers"""
+
+    def __init__(self, dialect, connection, **kwargs):
+        super().__init__(dialect, connection, **kwargs)
+        self.indexes = []
+
+    def visit_index(self, index, create_ok=False):
+        self.indexes.append(index)
+
+
+def _create_table(engine, table, foreign_key_constraints):
+    with engine.begin() as connection:
+        generator = _TableGenerator(connection.dialect, connection)
+        generator.traverse_single(
+            table,
+            create_ok=True,
+            include_foreign_key_constraints=foreign_key_constraints,
+            _is_metadata_operation=True,
+        )
+    return generator.indexes
+
+
+def _create_index(engine, index):
+    with engine.begin() as connection:
+        SchemaGenerator(connection.dialect, connection).traverse_single(index, create_ok=True)
+    return ()
+
+
+def _drop_table(engine, table, sequences):
+    with engine.begin() as connection:
+        SchemaDropper(connection.dialect, connection).traverse_single(
+            table, drop_ok=True, _is_metadata_operation=True, _ignore_sequences=sequences
+        )
+    return ()
+
+
+def _run(workers, waiting, table_task, index_task=None):
+    # waiting: {table: set of the tables to process before it}
+    #   A task returns the indexes to build after its table
+    blocking = {}
+    for table, tables in waiting.items():
+        for other in tables:
+            blocking.setdefault(other, []).append(table)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="interbase-ddl") as executor:
+        running = {}
+
+        def submit(fn, item, table=None):
+            running[executor.submit(fn, item)] = table
+
+        for table, tables in waiting.items():
+            if not tables:
+                submit(table_task, table, table)
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                table = running.pop(future)
+                try:
+                    indexes = future.result()
+                except BaseException:
+                    for other in running:
+                        other.cancel()
+                    raise
+
+                for index in indexes:
+                    submit(index_task, index)
+                for other in blocking.get(table, ()):
+                    waiting[other].discard(table)
+                    if not waiting[other]:
+                        submit(table_task, other, other)
+
+
+def create_all(engine, metadata, workers=DEFAULT_WORKERS, checkfirst=True, tables=None):
+    """metadata.create_all(engine) with the tables and indexes built by workers threads"""
+    with engine.connect() as connection:
+        generator = SchemaGenerator(connection.dialect, connection, checkfirst, tables)
+        if tables is None:
+            tables = list(metadata.tables.values())
+
+        collection = sort_tables_and_constraints(
+            [table for table in tables if generator._can_create_table(table)]
+        )
+        sequences = [
+            sequence
+            for sequence in metadata._sequences.values()
+            if sequence.column is None and generator._can_create_sequence(sequence)
+        ]
+        events_kw = dict(
+            tables=[table for table, _ in collection if table is not None],
+            checkfirst=checkfirst,
+            _ddl_runner=generator,
+        )
+
+        metadata.dispatch.before_create(metadata, connection, **events_kw)
+        for sequence in sequences:
+            generator.traverse_single(sequence, create_ok=True)
+        connection.commit()
+
+        foreign_key_constraints = {}
+        cycles = ()
+        for table, table_constraints in collection:
+            if table is None:
+                cycles = table_constraints
+            else:
+                foreign_key_constraints[table] = table_constraints
+
+        waiting = {
+            table: {
+                constraint.referred_table for constraint in table_constraints
+            }.intersection(foreign_key_constraints).difference([table])
+            for table, table_constraints in foreign_key_constraints.items()
+        }
+        _run(
+            workers,
+            waiting,
+            lambda table: _create_table(engine, table, foreign_key_constraints[table]),
+            lambda index: _create_index(engine, index),
+        )
+
+        for constraint in cycles:
+            generator.traverse_single(constraint)
+        metadata.dispatch.after_create(metadata, connection, **events_kw)
+        connection.commit()
+
+
+def drop_all(engine, metadata, workers=DEFAULT_WORKERS, checkfirst=True, tables=None):
+    """metadata.drop_all(engine) with the tables dropped by workers threads"""
+    with engine.connect() as connection:
+        dropper = SchemaDropper(connection.dialect, connection, checkfirst, tables)
+        if tables is None:
+            tables = list(metadata.tables.values())
+
+        # Named foreign keys of dependency cycles are dropped first
+        unsorted_tables = [table for table in tables if dropper._can_drop_table(table)]
+        try:
+            collection = sort_tables_and_constraints(
+                unsorted_tables,
+                filter_fn=lambda constraint: False if constraint.name is None else None,
+            )
+        except exc.CircularDependencyError as err:
+            # As metadata.drop_all() of a backend without ALTER, a partial sort
+            util.warn(
+                "Can't sort tables for DROP; an unresolvable foreign key "
+                "dependency exists between tables: %s. Please ensure that the "
+                "ForeignKey and ForeignKeyConstraint objects involved in the "
+                "cycle have names so that they can be dropped using DROP "
+                "CONSTRAINT." % ", ".join(sorted(table.fullname for table in err.cycles))
+            )
+            collection = sort_tables_and_constraints(unsorted_tables)
+        sequences = [
+            sequence
+            for sequence in metadata._sequences.values()
+            if dropper._can_drop_sequence(sequence)
+        ]
+        events_kw = dict(
+            tables=[table for table, _ in reversed(collection) if table is not None],
+            checkfirst=checkfirst,
+            _ddl_runner=dropper,
+        )
+
+        metadata.dispatch.before_drop(metadata, connection, **events_kw)
+        waiting = {}
+        for table, table_constraints in collection:
+            if table is None:
+                for constraint in table_constraints:
+                    if constraint.name is not None:
+                        dropper.traverse_single(constraint)
+            else:
+                waiting.setdefault(table, set())
+        connection.commit()
+
+        for table, table_constraints in collection:
+            for constraint in table_constraints or ():
+                referred = constraint.referred_table
+                if table is not None and referred in waiting and referred is not table:
+                    waiting[referred].add(table)
+        _run(workers, waiting, lambda table: _drop_table(engine, table, sequences))
+
+        for sequence in sequences:
+            dropper.traverse_single(sequence, drop_ok=sequence.column is None)
+        metadata.dispatch.after_drop(metadata, connection, **events_kw)
+        connection.commit()
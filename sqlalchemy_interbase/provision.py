@@ -2,6 +2,7 @@ from sqlalchemy import event
 from sqlalchemy.engine import Engine
 from sqlalchemy.schema import CreateTable, DropTable, CreateIndex, DropIndex
 from sqlalchemy.testing.provision import temp_table_keyword_args
+from sqlalchemy.testing.provision import update_db_opts
 
 
 @temp_table_keyword_args.for_db("interbase")
@@ -13,12 +14,21 @@ def _interbase_temp_table_keyword_args(cfg, eng):
     }
 
 
+@update_db_opts.for_db("interbase")
+def _interbase_update_db_opts(db_url, db_opts, options):
+    # Tables and indexes are committed in a few transactions, the tests see
+    #   them committed as with the listener below (see IBDialect.ddl_batching)
+    db_opts.setdefault("ddl_batching", "statement")
+
+
 @event.listens_for(Engine, "after_execute")
 def receive_after_execute(connection, statement, *arg):
     #
     # Important: Statements executed with connection.exec_driver_sql() don't pass through here.
     #            Use connection.execute(text()) instead.
     #
+    if getattr(connection.dialect, "ddl_batching", False):
+        return
     if isinstance(statement, (CreateTable, DropTable, CreateIndex, DropIndex)):
         # Using Connection protected methods here because the public ones cause errors with TransactionManager
         connection._commit_impl()
@@ -0,0 +1,108 @@
+"""Persistent on-disk cache of reflection results
+
+The cache is opt-in and enabled by ``reflection_cache_dir``:
+
+    engine = create_engine(url, reflection_cache_dir="/var/cache/myservice")
+
+IBInspector stores its info_cache in a file of that directory, one file per
+database and user. The file is reused while the metadata fingerprint of the database
+(see FINGERPRINT_QUERY) is unchanged, so a warm start needs a single round trip.
+
+The cache is stored with pickle, the directory must be trusted.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+from sqlalchemy import util
+
+# Changes on any of these counters when metadata is created, altered or dropped.
+#   rdb$format is incremented by every ALTER TABLE of a relation. The ids of
+#   relations, fields and generators only grow, they tell a drop and create
+#   of the same number of objects. Comments, view sources and defaults are
+#   counted, the text of one changed in place isn't compared: clear_cache()
+#   of the inspector drops the file. ALTER INDEX ACTIVE/INACTIVE and SET
+#   STATISTICS change the state of an index in place, they're summed.
+FINGERPRINT_QUERY = """
+    SELECT
+        (SELECT COUNT(*) FROM rdb$relations) AS relations,
+        (SELECT SUM(rdb$format) FROM rdb$relations) AS formats,
+        (SELECT MAX(rdb$relation_id) FROM rdb$relations) AS relation_id,
+        (SELECT COUNT(rdb$description) FROM rdb$relations) AS relation_descriptions,
+        (SELECT COUNT(rdb$view_source) FROM rdb$relations) AS view_sources,
+        (SELECT COUNT(*) FROM rdb$relation_fields) AS relation_fields,
+        (SELECT MAX(rdb$field_id) FROM rdb$relation_fields) AS field_id,
+        (SELECT COUNT(rdb$description) FROM rdb$relation_fields) AS field_descriptions,
+        (SELECT COUNT(rdb$default_source) FROM rdb$relation_fields) AS field_defaults,
+        (SELECT COUNT(*) FROM rdb$fields) AS fields,
+        (SELECT COUNT(rdb$description) FROM rdb$fields) AS domain_descriptions,
+        (SELECT COUNT(rdb$default_source) FROM rdb$fields) AS domain_defaults,
+        (SELECT COUNT(*) FROM rdb$indices) AS indices,
+        (SELECT SUM(COALESCE(rdb$index_inactive, 0)) FROM rdb$indices) AS inactive_indices,
+        (SELECT SUM(rdb$statistics) FROM rdb$indices) AS index_statistics,
+        (SELECT COUNT(*) FROM rdb$relation_constraints) AS relation_constraints,
+        (SELECT COUNT(*) FROM rdb$generators) AS generators,
+        (SELECT MAX(rdb$generator_id) FROM rdb$generators) AS generator_id,
+        (SELECT COUNT(*) FROM rdb$triggers) AS triggers
+    FROM rdb$database
+"""
+
+
+class ReflectionCache:
+    def __init__(self, directory, url):
+        # One file per database and user: host, port, database path and user name,
+        #   the privileges of the user may hide objects
+        key = f"{url.username or ''}@{url.host or ''}:{url.port or ''}:{url.database or ''}"
+        self.directory = directory
+        self.path = os.path.join(
+            directory,
+            "interbase-%s.pickle" % hashlib.sha1(key.encode()).hexdigest(),
+        )
+        # len() of the info_cache when it was last loaded or saved
+        self.saved_size = 0
+
+    def fingerprint(self, connection):
+        return tuple(connection.exec_driver_sql(FINGERPRINT_QUERY).first())
+
+    def load(self, fingerprint):
+        """Return the cached info_cache, or None if missing or outdated"""
+        try:
+            with open(self.path, "rb") as f:
+                cached_fingerprint, info_cache = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            return None
+
+        if cached_fingerprint != fingerprint:
+            return None
+
+        self.saved_size = len(info_cache)
+        return info_cache
+
+    def save(self, fingerprint, info_cache):
+        # Write to a temporary file and rename it, readers never see a partial file
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump((fingerprint, dict(info_cache)), f)
+                os.replace(tmp_path, self.path)
+                self.saved_size = len(info_cache)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as err:
+            util.warn(f"Unable to save reflection cache {self.path}: {err}")
+
+    def save_unsaved(self, fingerprint, info_cache):
+        if len(info_cache) > self.saved_size:
+            self.save(fingerprint, info_cache)
+
+    def clear(self):
+        self.saved_size = 0
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
@@ -2,7 +2,7 @@ import datetime as dt
 
 from typing import Any
 from typing import Optional
-from sqlalchemy import Dialect, types as sqltypes
+from sqlalchemy import Dialect, exc, types as sqltypes
 
 # Character set of BINARY/VARBINARY
 BINARY_CHARSET = "OCTETS"
@@ -149,21 +149,154 @@ class IBBOOLEAN(sqltypes.BOOLEAN):
     render_bind_cast = True
 
 
+class _IBBlobStream:
+    """File-like adapter for streamed BLOB parameters.
+
+    The driver writes file-like parameters with ``read()`` calls until an
+    empty chunk is returned, one BLOB segment per call. Each read returns
+    at most ``segment_size`` bytes of the wrapped file-like object or iterator.
+    """
+
+    def __init__(self, source, segment_size, encoding):
+        self._segment_size = segment_size
+        self._encoding = encoding
+        self._read = getattr(source, "read", None)
+        self._chunks = None if self._read else iter(source)
+        self._pending = b""
+
+    def _encode(self, chunk):
+        if isinstance(chunk, str):
+            return chunk.encode(self._encoding)
+        return chunk if isinstance(chunk, bytes) else bytes(chunk)
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self._segment_size:
+            size = self._segment_size
+
+        # Buffer at most one chunk, text is longer once encoded
+        while not self._pending:
+            if self._read is not None:
+                chunk = self._read(size)
+                if not chunk:
+                    return b""
+            else:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    return b""
+            self._pending = self._encode(chunk)
+
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+
+class IBBlobHandle:
+    """Deferred value of a lazy BLOB column.
+
+    The content is read from the server on the first access of ``value``
+    and kept afterwards. A handle is bound to the transaction that fetched
+    it: reading it once that transaction has been committed or rolled back
+    raises InvalidRequestError, values already read stay available.
+    """
+
+    __slots__ = ("_reader", "_transaction", "_value")
+
+    def __init__(self, reader, transaction):
+        self._reader = reader
+        self._transaction = transaction
+        self._value = None
+
+    @property
+    def loaded(self):
+        return self._reader is None
+
+    @property
+    def value(self):
+        if self._reader is not None:
+            if not self._transaction.active:
+                raise exc.InvalidRequestError(
+                    "BLOB handle can't be read, the transaction that "
+                    "fetched it has ended"
+                )
+            try:
+                self._value = self._reader.read()
+            finally:
+                self._reader.close()
+            self._reader = None
+        return self._value
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "deferred"
+        return f"<{self.__class__.__name__} {state}>"
+
+
 class _IBLargeBinary(sqltypes.LargeBinary):
     render_bind_cast = True
 
+    # Segment size used to write streamed parameters of columns without segment_size
+    default_segment_size = 32 * 1024
+
     def __init__(
-            self, subtype=None, segment_size=None, charset=None, collation=None
+            self,
+            subtype=None,
+            segment_size=None,
+            charset=None,
+            collation=None,
+            stream=False,
+            lazy=False,
     ):
         super().__init__()
         self.subtype = subtype
         self.segment_size = segment_size
         self.charset = charset
         self.collation = collation
+        # Return BLOB values as lazy, seekable file-like objects
+        #   (interbase.BlobReader) instead of fully loaded values.
+        #   Stream values are valid until the transaction ends, but the driver
+        #   closes the readers already being read when the cursor closes, that
+        #   is when the result is exhausted or closed: finish reading a value
+        #   before fetching the last row. Ignored by the asyncio dialect.
+        self.stream = stream
+        # Return BLOB values as IBBlobHandle, read from the server on access.
+        #   Enabled for all BLOB columns of a statement with the
+        #   interbase_lazy_blobs execution option. Ignored by the asyncio dialect.
+        self.lazy = lazy
+
+    @staticmethod
+    def _is_stream(value):
+        # File-like objects and iterators of chunks
+        return hasattr(value, "read") or (
+            hasattr(value, "__next__") and not isinstance(value, (bytes, str))
+        )
 
     def bind_processor(self, dialect):
+        segment_size = self.segment_size or self.default_segment_size
+        encoding = getattr(dialect, "python_charset", None) or "utf-8"
+
+        def process(value):
+            # The driver consumes bytes and str (text BLOBs) as they are
+            if value is None or value.__class__ is bytes or value.__class__ is str:
+                return value
+            if self._is_stream(value):
+                return _IBBlobStream(value, segment_size, encoding)
+            # Other buffers (bytearray, memoryview, arrays) are copied once,
+            #   the driver only accepts bytes for non-stream BLOB parameters.
+            return bytes(value)
+
+        return process
+
+    def result_processor(self, dialect, coltype):
+        if (self.stream or self.lazy) and not dialect.is_async:
+            return None  # interbase.BlobReader or IBBlobHandle, see IBExecutionContext.post_exec
+
+        process_value = super().result_processor(dialect, coltype)
+        if process_value is None:
+            return None
+
         def process(value):
-            return None if value is None else bytes(value)
+            # Handles of statements executed with interbase_lazy_blobs
+            if value.__class__ is IBBlobHandle:
+                return value
+            return process_value(value)
 
         return process
 
@@ -177,8 +310,10 @@ class IBBLOB(_IBLargeBinary, sqltypes.BLOB):
             subtype=None,  # Default subtype
             charset=None,
             collation=None,
+            stream=False,
+            lazy=False,
     ):
-        super().__init__(subtype, segment_size, charset, collation)
+        super().__init__(subtype, segment_size, charset, collation, stream, lazy)
 
 
 class IBTEXT(_IBLargeBinary, sqltypes.TEXT):
@@ -189,8 +324,10 @@ class IBTEXT(_IBLargeBinary, sqltypes.TEXT):
             segment_size=None,
             charset=None,
             collation=None,
+            stream=False,
+            lazy=False,
     ):
-        super().__init__(1, segment_size, charset, collation)
+        super().__init__(1, segment_size, charset, collation, stream, lazy)
 
 
 class _IBNumericInterval(_IBNumeric):
@@ -0,0 +1,128 @@
+import types
+from unittest import mock
+
+import interbase
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import registry
+
+# Also without the package installed (entry points in pyproject.toml)
+registry.register("interbase", "sqlalchemy_interbase.base", "IBDialect")
+registry.register("interbase.async", "sqlalchemy_interbase.async_dialect", "IBDialect_async")
+
+
+class PreparedStatement:
+    def __init__(self, cursor, sql):
+        self.cursor = cursor
+        self.sql = sql
+
+
+class Cursor:
+    description = None
+    rowcount = -1
+    arraysize = 1
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.rows = []
+        self.closed = False
+        connection.cursors.append(self)
+
+    def prep(self, operation):
+        self.connection.prepared.append(" ".join(operation.split()))
+        return PreparedStatement(self, operation)
+
+    def execute(self, operation, parameters=None):
+        operation = getattr(operation, "sql", operation)
+        self.connection.statements.append(" ".join(operation.split()))
+        self.connection.parameters.append(parameters)
+        self.connection.main_transaction.active = True
+        self.description, self.rows = None, []
+        for key, result in self.connection.results.items():
+            if key in operation:
+                if isinstance(result, Exception):
+                    raise result
+                names, rows = result if isinstance(result, tuple) else (None, result)
+                if names is not None:
+                    # Names, or full description items
+                    self.description = [
+                        name if isinstance(name, tuple) else (name, None, None, None, None, None, True)
+                        for name in names
+                    ]
+                self.rows = list(rows)
+                break
+
+    def fetchone(self):
+        return self.rows.pop(0) if self.rows else None
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        return rows
+
+    def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+    def close(self):
+        self.closed = True
+
+
+class Connection:
+    """Records the statements, commits and rollbacks of a connection"""
+
+    version = "14.1.0.70"
+
+    def __init__(self, statements, results):
+        self.statements = statements
+        # {part of a statement: rows, (column names, rows) of its result or an error}
+        self.results = results
+        self.parameters = []  # Parameters of each execute()
+        self.prepared = []  # Statements of each prep()
+        self.cursors = []
+        self.main_transaction = mock.Mock(active=False)
+
+    def cursor(self):
+        return Cursor(self)
+
+    def commit(self, retaining=False):
+        self.statements.append("COMMIT RETAINING" if retaining else "COMMIT")
+        self.main_transaction.active = retaining
+
+    def rollback(self, retaining=False, savepoint=None):
+        self.statements.append("ROLLBACK RETAINING" if retaining else "ROLLBACK")
+        self.main_transaction.active = retaining
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def statements():
+    return []
+
+
+@pytest.fixture
+def results():
+    return {}
+
+
+@pytest.fixture
+def dbapi(statements, results):
+    """The driver, with connections recording their statements"""
+    dbapi = types.SimpleNamespace(**vars(interbase))
+    dbapi.connect = lambda *args, **kw: Connection(statements, results)
+    return dbapi
+
+
+@pytest.fixture
+def make_engine(dbapi, statements):
+    """An engine recording the statements of a fake DBAPI connection"""
+
+    def make_engine(**kwargs):
+        engine = create_engine("interbase://u:p@localhost/x.ib", module=dbapi, **kwargs)
+        engine.connect().close()
+        statements.clear()
+        return engine
+
+    return make_engine
@@ -0,0 +1,42 @@
+import asyncio
+
+from sqlalchemy import Column, MetaData, Table, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from sqlalchemy_interbase.async_dialect import AsyncAdapt_interbase_dbapi
+from sqlalchemy_interbase.types import IBBLOB
+
+
+def test_cursor_closed(dbapi):
+    async def run():
+        engine = create_async_engine(
+            "interbase+async://u:p@localhost/x.ib", module=AsyncAdapt_interbase_dbapi(dbapi)
+        )
+        async with engine.connect() as connection:
+            await connection.execute(text("UPDATE t SET n = 1"))
+            dbapi_connection = (await connection.get_raw_connection()).driver_connection
+        await engine.dispose()
+        return dbapi_connection
+
+    dbapi_connection = asyncio.run(run())
+    assert dbapi_connection.cursors
+    assert all(cursor.closed for cursor in dbapi_connection.cursors)
+
+
+def test_blobs_fetched_in_full(dbapi, results):
+    table = Table("t", MetaData(), Column("data", IBBLOB(stream=True)), Column("image", IBBLOB()))
+    results["SELECT t.data"] = (("data", "image"), [(b"\x00", b"\x01")])
+
+    async def run():
+        engine = create_async_engine(
+            "interbase+async://u:p@localhost/x.ib", module=AsyncAdapt_interbase_dbapi(dbapi)
+        )
+        async with engine.connect() as connection:
+            result = await connection.execute(
+                select(table), execution_options={"interbase_lazy_blobs": True}
+            )
+            rows = result.all()
+        await engine.dispose()
+        return rows
+
+    assert asyncio.run(run()) == [(b"\x00", b"\x01")]
@@ -0,0 +1,79 @@
+from sqlalchemy import Column, Integer, MetaData, String, Table, inspect
+
+from sqlalchemy_interbase.base import _autoincrement_stored_names
+from sqlalchemy_interbase.ib_info import MAX_IDENTIFIER_LENGTH
+
+
+def make_metadata(name="account"):
+    metadata = MetaData()
+    Table(name, metadata, Column("id", Integer, primary_key=True), Column("name", String(20)))
+    return metadata
+
+
+def test_names():
+    assert _autoincrement_stored_names("ACCOUNT", "ID") == ("ACCOUNT_ID_GEN", "ACCOUNT_ID_TRG")
+
+
+def test_long_names_cut_with_hash():
+    generator, trigger = _autoincrement_stored_names("CUSTOMER_ACCOUNT_HISTORY", "ENTRY_ID")
+    other_generator, other_trigger = _autoincrement_stored_names("CUSTOMER_ACCOUNT_HISTORY", "ENTRY_NO")
+
+    assert len(generator) == len(trigger) == MAX_IDENTIFIER_LENGTH
+    assert generator.startswith("CUSTOMER_ACCOUNT_HISTO_") and generator.endswith("_GEN")
+    assert trigger[:-4] == generator[:-4] and trigger.endswith("_TRG")
+    assert other_generator != generator and other_trigger != trigger
+
+
+def test_trigger_created_after_commit(make_engine, statements):
+    engine = make_engine()
+    make_metadata().create_all(engine, checkfirst=False)
+
+    assert statements[0] == "CREATE GENERATOR account_id_gen"
+    assert statements[1] == "CREATE TABLE account ( id INTEGER, name VARCHAR(20), PRIMARY KEY (id) )"
+    assert statements[2] == "COMMIT"
+    assert statements[3].startswith("CREATE TRIGGER account_id_trg FOR account BEFORE INSERT")
+    assert statements[4] == "COMMIT"
+
+
+def test_generator_dropped_after_commit(make_engine, statements, results):
+    engine = make_engine()
+    results["SELECT"] = [(1,)]
+    make_metadata().drop_all(engine, checkfirst=False)
+
+    assert statements[1] == "DROP TABLE account"
+    assert statements[2] == "COMMIT"
+    assert statements[3] == "DROP GENERATOR account_id_gen"
+    assert statements[4] == "COMMIT"
+
+
+def test_long_trigger_name(make_engine, statements):
+    engine = make_engine()
+    make_metadata("customer_account_history").create_all(engine, checkfirst=False)
+
+    generator, trigger = _autoincrement_stored_names("CUSTOMER_ACCOUNT_HISTORY", "ID")
+    assert statements[0] == "CREATE GENERATOR %s" % generator.lower()
+    assert statements[3].startswith("CREATE TRIGGER %s FOR" % trigger.lower())
+
+
+
+COLUMN_NAMES = (
+    "relation_name", "field_name", "null_flag", "field_type", "field_length",
+    "field_precision", "field_scale", "field_sub_type", "segment_length",
+    "character_set_name", "collation_name", "default_source", "description",
+    "autoincrement_triggers", "computed_source",
+)
+
+
+def column_row(name, autoincrement_triggers):
+    return ("ACCOUNT", name, 1, "LONG", 4, 0, 0, None, None, None, None, None, None, autoincrement_triggers, None)
+
+
+def test_trigger_reflected_by_column_dependency(make_engine, statements, results):
+    engine = make_engine()
+    results["rdb$relation_fields rf"] = (COLUMN_NAMES, [column_row("ID", 1), column_row("NO", 0)])
+    columns = inspect(engine).get_columns("account")
+
+    assert [column.get("autoincrement") for column in columns] == [True, None]
+    query = next(statement for statement in statements if "rdb$relation_fields rf" in statement)
+    assert "JOIN rdb$dependencies d" in query
+    assert "FROM 1 FOR %d) || '_____\\_TRG'" % (MAX_IDENTIFIER_LENGTH - len("_XXXX_TRG")) in query
@@ -0,0 +1,38 @@
+import decimal
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Numeric, Table, select, text
+
+from sqlalchemy_interbase.columnar import columns_as_arrays
+from sqlalchemy_interbase.types import IBINT128
+
+numpy = pytest.importorskip("numpy")
+
+BIG = 2 ** 100
+
+
+def test_int128_and_numeric_kept_as_objects(make_engine, results):
+    engine = make_engine()
+    table = Table("t", MetaData(), Column("id", Integer), Column("big", IBINT128), Column("amount", Numeric(18, 4)))
+    results["SELECT t.id"] = (("id", "big", "amount"), [(1, BIG, decimal.Decimal("0.1234")), (2, None, None)])
+
+    with engine.connect() as connection:
+        arrays = columns_as_arrays(connection.execute(select(table)), batch_size=1)
+
+    assert arrays["id"].dtype == numpy.int64
+    assert arrays["big"].dtype == object and list(arrays["big"]) == [BIG, None]
+    assert arrays["amount"].dtype == object and arrays["amount"][0] == decimal.Decimal("0.1234")
+
+
+def test_textual_int128_kept_as_objects(make_engine, results):
+    engine = make_engine()
+    results["SELECT id"] = (
+        [("ID", int, 11, 4, 0, 0, False), ("BIG", int, 40, 16, 0, 0, True)],
+        [(1, BIG)],
+    )
+
+    with engine.connect() as connection:
+        arrays = columns_as_arrays(connection.execute(text("SELECT id, big FROM t")))
+
+    assert arrays["id"].dtype == numpy.int64
+    assert arrays["big"].dtype == object and arrays["big"][0] == BIG
@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy import text
+
+
+@pytest.fixture
+def engine(make_engine):
+    return make_engine(commit_retaining=True)
+
+
+def test_commit_retaining(engine, statements):
+    with engine.connect() as connection:
+        connection.execute(text("UPDATE t SET n = 1"))
+        connection.commit()
+        connection.execute(text("UPDATE t SET n = 2"))
+        connection.rollback()
+
+        assert statements == [
+            "UPDATE t SET n = 1",
+            "COMMIT RETAINING",
+            "UPDATE t SET n = 2",
+            "ROLLBACK RETAINING",
+        ]
+
+
+def test_returned_connection_ends_transaction(engine, statements):
+    with engine.connect() as connection:
+        connection.execute(text("UPDATE t SET n = 1"))
+        connection.commit()
+
+    # The transaction kept open by the commit ends in the pool
+    assert statements[-2:] == ["COMMIT RETAINING", "ROLLBACK"]
+    assert engine.dialect.commit_stats["hard_rollbacks"] == 1
+
+
+def test_reset_on_return_not_retaining(engine, statements):
+    connection = engine.raw_connection()
+    cursor = connection.cursor()
+    cursor.execute("UPDATE t SET n = 1")
+    connection.close()
+
+    assert statements == ["UPDATE t SET n = 1", "ROLLBACK"]
+
+
+def test_isolation_level_keeps_transaction(engine, statements):
+    with engine.connect() as connection:
+        connection.execute(text("UPDATE t SET n = 1"))
+        connection.commit()
+        connection.execute(text("UPDATE t SET n = 2"))
+        dbapi_connection = connection.connection.dbapi_connection
+        engine.dialect.set_isolation_level(dbapi_connection, "SERIALIZABLE")
+        assert statements[-1] == "UPDATE t SET n = 2"
+
+        # The new TPB applies from the next transaction
+        connection.commit()
+        assert statements[-1] == "COMMIT"
+        assert dbapi_connection.main_transaction.default_tpb == b"\x03\x09\x01\x06"
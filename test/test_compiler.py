@@ -0,0 +1,44 @@
+from sqlalchemy import Integer, String, bindparam, column, func, select, table
+
+from sqlalchemy_interbase.base import IBDialect
+
+t = table("t", column("id", Integer), column("name", String(20)))
+
+
+def where_sql(criterion, bind_casts="selective"):
+    statement = select(t.c.id).where(criterion)
+    sql = str(statement.compile(dialect=IBDialect(bind_casts=bind_casts)))
+    return sql.split("WHERE ", 1)[1]
+
+
+def test_selective_comparison_bind_not_cast():
+    assert where_sql(t.c.id == 5) == "t.id = :id_1"
+    assert where_sql(t.c.name.like("a%")) == "t.name LIKE :name_1"
+
+
+def test_always_comparison_bind_cast():
+    assert where_sql(t.c.id == 5, "always") == "t.id = CAST(:id_1 AS INTEGER)"
+
+
+def test_selective_ilike_bind_cast():
+    assert where_sql(t.c.name.ilike("x")) == (
+        "lower(t.name) LIKE lower(CAST(:name_1 AS VARCHAR(20)))"
+    )
+
+
+def test_selective_contains_bind_cast():
+    assert where_sql(t.c.name.contains("x")) == (
+        "(t.name LIKE '%' || CAST(:name_1 AS VARCHAR(20)) || '%')"
+    )
+
+
+def test_selective_startswith_bind_cast():
+    assert where_sql(t.c.name.startswith("x")) == (
+        "(t.name LIKE CAST(:name_1 AS VARCHAR(20)) || '%')"
+    )
+
+
+def test_selective_function_argument_bind_cast():
+    assert where_sql(t.c.name == func.lower(bindparam("x", type_=String(20)))) == (
+        "t.name = lower(CAST(:x AS VARCHAR(20)))"
+    )
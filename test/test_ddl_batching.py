@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, Table, exc, text
+
+
+@pytest.fixture
+def engine(make_engine):
+    return make_engine(ddl_batching=True)
+
+
+@pytest.fixture
+def metadata():
+    metadata = MetaData()
+    Table("parent", metadata, Column("id", Integer, primary_key=True, autoincrement=False))
+    Table("child", metadata, Column("parent_id", ForeignKey("parent.id")))
+    return metadata
+
+
+def test_dml_before_ddl_not_committed_early(engine, metadata, statements):
+    with engine.begin() as connection:
+        connection.execute(text("UPDATE audit SET n = n + 1"))
+        metadata.create_all(connection, checkfirst=False)
+        assert "COMMIT" not in statements
+
+    assert statements[0] == "UPDATE audit SET n = n + 1"
+    assert statements[1].startswith("CREATE TABLE parent")
+    # The transaction (UPDATE, CREATE TABLE parent) is committed first, then
+    #   the foreign key to parent runs
+    assert statements[2] == "COMMIT"
+    assert statements[3].startswith("CREATE TABLE child")
+    assert statements[4] == "COMMIT"
+
+
+def test_statement_while_ddl_waits_raises(engine, metadata, statements):
+    with engine.connect() as connection:
+        metadata.create_all(connection, checkfirst=False)
+        with pytest.raises(exc.InvalidRequestError):
+            connection.execute(text("SELECT 1 FROM rdb$database"))
+        connection.rollback()
+
+    assert "COMMIT" not in statements
+
+
+def test_executemany_ddl_waits(engine, metadata, statements):
+    with engine.begin() as connection:
+        metadata.tables["parent"].create(connection)
+        connection.exec_driver_sql("CREATE INDEX ix_parent ON parent (id)", [(), ()])
+        assert "CREATE INDEX ix_parent ON parent (id)" not in statements
+
+    assert statements[1:4] == ["COMMIT", "CREATE INDEX ix_parent ON parent (id)", "COMMIT"]
+    assert statements.count("CREATE INDEX ix_parent ON parent (id)") == 1
+
+
+def test_statement_mode_commits_before_statement(make_engine, metadata, statements):
+    engine = make_engine(ddl_batching="statement")
+    with engine.connect() as connection:
+        metadata.create_all(connection, checkfirst=False)
+        connection.execute(text("SELECT 1 FROM rdb$database"))
+
+    assert statements[0].startswith("CREATE TABLE parent")
+    assert statements[1] == "COMMIT"
+    assert statements[2].startswith("CREATE TABLE child")
+    assert statements[3] == "COMMIT"
+    assert statements[4] == "SELECT 1 FROM rdb$database"
+
+
+def test_invalid_ddl_batching(make_engine):
+    with pytest.raises(exc.ArgumentError):
+        make_engine(ddl_batching="always")
@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy import Integer, column, exc, select, table
+
+from sqlalchemy_interbase.base import IBDialect
+
+t = table("t", column("id", Integer))
+
+
+def where_sql(criterion, **kwargs):
+    statement = select(t.c.id).where(criterion)
+    compiled = statement.compile(
+        dialect=IBDialect(**kwargs), compile_kwargs={"render_postcompile": True}
+    )
+    return str(compiled).split("WHERE ", 1)[1]
+
+
+def test_list_at_limit_not_split():
+    sql = where_sql(t.c.id.in_(range(1500)), bind_casts="selective")
+
+    assert sql.startswith("(t.id IN (:id_1_1, ")
+    assert sql.count(" IN ") == 1
+    assert sql.count(":id_1_") == 1500
+
+
+def test_list_over_limit_split_with_or():
+    sql = where_sql(t.c.id.in_(range(1501)), bind_casts="selective")
+
+    assert sql.count(" IN ") == 2
+    assert sql.endswith(":id_1_1500) OR t.id IN (:id_1_1501))")
+
+
+def test_not_in_split_with_and():
+    sql = where_sql(t.c.id.not_in(range(1501)), bind_casts="selective")
+
+    assert sql.count(" NOT IN ") == 2
+    assert sql.endswith(":id_1_1500) AND t.id NOT IN (:id_1_1501))")
+
+
+def test_split_list_keeps_casts():
+    sql = where_sql(t.c.id.in_(range(1501)))
+
+    assert sql.endswith("OR t.id IN (CAST(:id_1_1501 AS INTEGER)))")
+
+
+def test_oversized_list_raises_without_threshold():
+    # 3200 CAST(? AS INTEGER) are over 64k characters
+    with pytest.raises(exc.ArgumentError, match="3200 items"):
+        where_sql(t.c.id.in_(range(3200)))
+
+
+def test_oversized_message_raises_without_threshold():
+    # 7000 parameters of 10 bytes exceed the input message
+    with pytest.raises(exc.ArgumentError, match="7000 items"):
+        where_sql(t.c.id.in_(range(7000)), bind_casts="selective")
+
+
+def test_oversized_list_loaded_in_temporary_table():
+    sql = where_sql(t.c.id.in_(range(3200)), in_list_temp_table_threshold=10000)
+
+    assert sql == "(t.id IN (SELECT INT_VALUE FROM SQLA_IN_LIST WHERE LIST_ID = :id_1_in_list))"
+
+
+def test_list_over_threshold_loaded_in_temporary_table(make_engine, statements):
+    engine = make_engine(in_list_temp_table_threshold=10)
+    with engine.connect() as connection:
+        connection.execute(select(t.c.id).where(t.c.id.in_(range(20))))
+
+    assert statements[0].startswith("INSERT INTO SQLA_IN_LIST (LIST_ID, INT_VALUE) SELECT 1, CAST(? AS BIGINT)")
+    assert statements[0].count(" UNION ALL ") == 19
+    assert statements[1].endswith("WHERE (t.id IN (SELECT INT_VALUE FROM SQLA_IN_LIST WHERE LIST_ID = ?))")
@@ -0,0 +1,98 @@
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, exc, insert
+
+from sqlalchemy_interbase.ib_info import MAX_CONTEXTS, MAX_MESSAGE_LENGTH, MAX_STATEMENT_LENGTH
+
+ROW = "SELECT CAST(? AS INTEGER), CAST(? AS VARCHAR(20)) FROM rdb$database"
+
+
+def make_table(*columns):
+    return Table("t", MetaData(), Column("id", Integer, primary_key=True), *columns)
+
+
+def run_insert(make_engine, statement, rows):
+    engine = make_engine()
+    with engine.connect() as connection:
+        connection.execute(statement, rows)
+        dbapi_connection = connection.connection.dbapi_connection
+    return [
+        (operation, parameters)
+        for operation, parameters in zip(dbapi_connection.statements, dbapi_connection.parameters)
+        if operation.startswith("INSERT")
+    ]
+
+
+def batch_sizes(inserts):
+    return [operation.count(" UNION ALL ") + 1 for operation, _ in inserts]
+
+
+def test_rows_selected_with_casts(make_engine):
+    table = make_table(Column("name", String(20)))
+    inserts = run_insert(make_engine, insert(table), [{"id": i, "name": "n%d" % i} for i in range(3)])
+
+    assert inserts == [
+        ("INSERT INTO t (id, name) " + " UNION ALL ".join([ROW] * 3), (0, "n0", 1, "n1", 2, "n2")),
+    ]
+
+
+def test_batch_size_clamped_to_contexts(make_engine):
+    table = make_table(Column("name", String(20)))
+    rows = [{"id": i, "name": "n"} for i in range(MAX_CONTEXTS + 10)]
+    inserts = run_insert(make_engine, insert(table), rows)
+
+    # The target table takes one context
+    assert batch_sizes(inserts) == [MAX_CONTEXTS - 1, 11]
+    assert [parameters[0] for _, parameters in inserts] == [0, MAX_CONTEXTS - 1]
+
+
+def test_batch_size_clamped_to_statement_length(make_engine):
+    table = make_table(*[Column("long_column_name_%02d" % i, Integer) for i in range(20)])
+    rows = [dict(id=i, **{"long_column_name_%02d" % c: c for c in range(20)}) for i in range(300)]
+    inserts = run_insert(make_engine, insert(table), rows)
+
+    row_length = len(inserts[0][0].split(" UNION ALL ")[1]) + len(" UNION ALL ")
+    first, *_ = batch_sizes(inserts)
+    assert first < MAX_CONTEXTS - 1 and sum(batch_sizes(inserts)) == 300
+    assert len(inserts[0][0]) <= MAX_STATEMENT_LENGTH < len(inserts[0][0]) + row_length
+
+
+def test_batch_size_clamped_to_message_length(make_engine):
+    table = make_table(Column("notes", String(1000)))
+    inserts = run_insert(make_engine, insert(table), [{"id": i, "notes": "x"} for i in range(40)])
+
+    # 1000 characters of 4 bytes, length and null indicator, 10 bytes of INTEGER
+    row_length = 1000 * 4 + 2 + 2 + 8 + 2
+    assert batch_sizes(inserts) == [16, 16, 8]
+    assert 16 * row_length <= MAX_MESSAGE_LENGTH < 17 * row_length
+
+
+def test_single_row_keeps_values(make_engine):
+    table = make_table(Column("name", String(20)))
+    inserts = run_insert(make_engine, insert(table), [{"id": 1, "name": "n"}])
+
+    assert inserts == [
+        ("INSERT INTO t (id, name) VALUES (CAST(? AS INTEGER), CAST(? AS VARCHAR(20)))", (1, "n")),
+    ]
+
+
+def test_return_defaults_not_returned(make_engine):
+    table = make_table(Column("name", String(20)))
+    inserts = run_insert(make_engine, insert(table).return_defaults(), [{"name": "a"}, {"name": "b"}])
+
+    assert inserts == [
+        (
+            "INSERT INTO t (name) SELECT CAST(? AS VARCHAR(20)) FROM rdb$database"
+            " UNION ALL SELECT CAST(? AS VARCHAR(20)) FROM rdb$database",
+            ("a", "b"),
+        ),
+    ]
+
+
+@pytest.mark.parametrize("sort_by_parameter_order", [False, True])
+def test_executemany_returning_rejected(make_engine, sort_by_parameter_order):
+    # RETURNING of INSERT ... SELECT returns a single row
+    table = make_table(Column("name", String(20)))
+    statement = insert(table).returning(table.c.id, sort_by_parameter_order=sort_by_parameter_order)
+
+    with pytest.raises(exc.StatementError, match="does not support INSERT..RETURNING"):
+        run_insert(make_engine, statement, [{"name": "a"}, {"name": "b"}])
@@ -0,0 +1,82 @@
+import pytest
+from sqlalchemy import Integer, column, exc, select, table
+
+from sqlalchemy_interbase.base import IBDialect
+from sqlalchemy_interbase.keyset import keyset_page, keyset_pages
+
+t = table("t", column("created", Integer), column("id", Integer))
+
+
+def where_sql(statement):
+    sql = str(statement.compile(dialect=IBDialect(bind_casts="selective")))
+    return " ".join(sql.split()).split("WHERE ", 1)[1]
+
+
+def test_first_page():
+    statement = keyset_page(select(t).order_by(t.c.created, t.c.id), 100)
+    assert "WHERE" not in str(statement.compile(dialect=IBDialect()))
+
+
+def test_ties_broken_by_next_key():
+    statement = keyset_page(select(t).order_by(t.c.created, t.c.id), 100, (5, 7))
+
+    assert where_sql(statement).startswith(
+        "t.created >= :created_1 AND (t.created > :created_2 OR t.created = :created_3 AND t.id > :id_1)"
+        " ORDER BY t.created, t.id"
+    )
+
+
+def test_descending_key():
+    statement = keyset_page(select(t).order_by(t.c.created.desc(), t.c.id), 100, (5, 7))
+
+    assert where_sql(statement).startswith(
+        "t.created <= :created_1 AND (t.created < :created_2 OR t.created = :created_3 AND t.id > :id_1)"
+        " ORDER BY t.created DESC, t.id"
+    )
+
+
+def test_single_key():
+    statement = keyset_page(select(t).order_by(t.c.id.desc()), 100, (7,))
+    assert where_sql(statement).startswith("t.id < :id_1 ORDER BY t.id DESC")
+
+
+@pytest.mark.parametrize(
+    "statement, last_key",
+    [
+        (select(t), None),
+        (select(t).order_by(t.c.id.nulls_first()), None),
+        (select(t).order_by(t.c.id).offset(10), None),
+        (select(t).order_by(t.c.created, t.c.id), (5,)),
+    ],
+)
+def test_rejected(statement, last_key):
+    with pytest.raises(exc.ArgumentError):
+        keyset_page(statement, 100, last_key)
+
+
+def test_pages_continue_after_last_row(make_engine, statements, results):
+    engine = make_engine(bind_casts="selective")
+    # The first page ends within a tie on created
+    results["WHERE"] = (("created", "id"), [(2, 4)])
+    results["FROM t"] = (("created", "id"), [(1, 1), (2, 3)])
+
+    with engine.connect() as connection:
+        pages = list(keyset_pages(connection, select(t).order_by(t.c.created, t.c.id), page_size=2))
+        parameters = connection.connection.dbapi_connection.parameters
+
+    assert pages == [[(1, 1), (2, 3)], [(2, 4)]]
+    assert [statement for statement in statements if statement.startswith("SELECT")] == [
+        "SELECT t.created, t.id FROM t ORDER BY t.created, t.id ROWS 1 TO CAST(? AS INTEGER)",
+        "SELECT t.created, t.id FROM t WHERE t.created >= ? AND (t.created > ? OR t.created = ? AND t.id > ?)"
+        " ORDER BY t.created, t.id ROWS 1 TO CAST(? AS INTEGER)",
+    ]
+    assert parameters[-1] == (2, 2, 2, 3, 2)
+
+
+def test_pages_need_keys_in_select_list(make_engine, results):
+    engine = make_engine()
+    results["FROM t"] = (("id",), [(1,), (2,)])
+
+    with engine.connect() as connection:
+        with pytest.raises(exc.InvalidRequestError):
+            list(keyset_pages(connection, select(t.c.id).order_by(t.c.created, t.c.id), page_size=2))
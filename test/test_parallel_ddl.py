@@ -0,0 +1,84 @@
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, Table, exc
+
+from sqlalchemy_interbase.parallel_ddl import create_all, drop_all
+
+
+def make_metadata():
+    metadata = MetaData()
+    Table("parent", metadata, Column("id", Integer, primary_key=True, autoincrement=False))
+    Table(
+        "child",
+        metadata,
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        Column("parent_id", Integer, ForeignKey("parent.id"), index=True),
+    )
+    Table(
+        "grandchild",
+        metadata,
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        Column("child_id", Integer, ForeignKey("child.id")),
+    )
+    Table("other", metadata, Column("id", Integer, primary_key=True, autoincrement=False))
+    return metadata
+
+
+def position(statements, prefix):
+    return next(index for index, statement in enumerate(statements) if statement.startswith(prefix))
+
+
+def test_created_after_referred_tables(make_engine, statements):
+    engine = make_engine()
+    create_all(engine, make_metadata(), workers=3, checkfirst=False)
+
+    created = [position(statements, "CREATE TABLE %s " % name) for name in ("parent", "child", "grandchild")]
+    assert created == sorted(created)
+    assert position(statements, "CREATE TABLE other ") >= 0
+    assert position(statements, "CREATE INDEX ix_child_parent_id") > created[1]
+
+
+def test_dropped_before_referred_tables(make_engine, statements):
+    engine = make_engine()
+    drop_all(engine, make_metadata(), workers=3, checkfirst=False)
+
+    dropped = [position(statements, "DROP TABLE %s" % name) for name in ("grandchild", "child", "parent")]
+    assert dropped == sorted(dropped)
+    assert position(statements, "DROP TABLE other") >= 0
+
+
+def make_cycle(name=None):
+    metadata = MetaData()
+    Table(
+        "a",
+        metadata,
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        Column("b_id", Integer, ForeignKey("b.id", name=name and "a_b_fk")),
+    )
+    Table(
+        "b",
+        metadata,
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        Column("a_id", Integer, ForeignKey("a.id", name=name and "b_a_fk")),
+    )
+    return metadata
+
+
+def test_named_cycle_constraints_dropped_first(make_engine, statements):
+    engine = make_engine()
+    drop_all(engine, make_cycle(name=True), workers=2, checkfirst=False)
+
+    constraints = [position(statements, "ALTER TABLE %s DROP CONSTRAINT" % name) for name in ("a", "b")]
+    tables = [position(statements, "DROP TABLE %s" % name) for name in ("a", "b")]
+    assert max(constraints) < min(tables)
+
+
+def test_unnamed_cycle_warns(make_engine, statements):
+    engine = make_engine()
+    with pytest.warns(exc.SAWarning, match="unresolvable foreign key dependency exists between tables: a, b"):
+        drop_all(engine, make_cycle(), workers=2, checkfirst=False)
+
+    assert not [statement for statement in statements if "DROP CONSTRAINT" in statement]
+    assert sorted(statement for statement in statements if statement.startswith("DROP TABLE")) == [
+        "DROP TABLE a",
+        "DROP TABLE b",
+    ]
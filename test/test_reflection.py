@@ -0,0 +1,123 @@
+from sqlalchemy import inspect
+
+COLUMN_NAMES = (
+    "relation_name", "field_name", "null_flag", "field_type", "field_length",
+    "field_precision", "field_scale", "field_sub_type", "segment_length",
+    "character_set_name", "collation_name", "default_source", "description",
+    "autoincrement_triggers", "computed_source",
+)
+
+
+def column_row(relation, name, null_flag=1):
+    return (relation, name, null_flag, "LONG", 4, 0, 0, None, None, None, None, None, None, 0, None)
+
+
+def reflection_results(results):
+    results["('PERSISTENT')"] = (("relation_name",), [("ACCOUNT",), ("ENTRY",), ("EMPTY",)])
+    results["rdb$relation_fields rf"] = (
+        COLUMN_NAMES,
+        [column_row("ACCOUNT", "ID"), column_row("ENTRY", "ID"), column_row("ENTRY", "AMOUNT", None)],
+    )
+
+
+def test_multi_columns_one_query(make_engine, statements, results):
+    engine = make_engine()
+    reflection_results(results)
+
+    columns = inspect(engine).get_multi_columns()
+
+    assert {key: [column["name"] for column in value] for key, value in columns.items()} == {
+        (None, "account"): ["id"],
+        (None, "entry"): ["id", "amount"],
+        (None, "empty"): [],
+    }
+    assert columns[(None, "entry")][1]["nullable"] is True
+    queries = [statement for statement in statements if "rdb$relation_fields rf" in statement]
+    assert len(queries) == 1 and "?" not in queries[0]
+
+
+def test_multi_columns_filter_names(make_engine, statements, results):
+    engine = make_engine()
+    reflection_results(results)
+
+    columns = inspect(engine).get_multi_columns(filter_names=["entry"])
+
+    assert list(columns) == [(None, "entry")]
+
+
+def test_multi_columns_cached_per_inspector(make_engine, statements, results):
+    engine = make_engine()
+    reflection_results(results)
+
+    inspector = inspect(engine)
+    inspector.get_multi_columns(filter_names=["account"])
+    inspector.get_multi_columns(filter_names=["entry"])
+
+    assert len([statement for statement in statements if "rdb$relation_fields rf" in statement]) == 1
+
+
+INDEX_NAMES = (
+    "relation_name", "index_name", "unique_flag", "descending_flag", "inactive_flag",
+    "statistics", "field_name", "expression_source", "condition_source",
+)
+
+
+def index_rows():
+    return [
+        ("ACCOUNT", "ACCOUNT_NAME", 1, 0, 0, 0.5, "NAME", None, None),
+        ("ENTRY", "ENTRY_ACCOUNT", 0, 1, 1, 0.01, "ACCOUNT_ID", None, None),
+        ("ENTRY", "ENTRY_ACCOUNT", 0, 1, 1, 0.01, "ID", None, None),
+    ]
+
+
+def test_indexes_bound_to_relation(make_engine, statements, results):
+    engine = make_engine()
+    results["rdb$indices ix"] = (INDEX_NAMES, index_rows()[1:])
+
+    with engine.connect() as connection:
+        indexes = inspect(connection).get_indexes("entry")
+        parameters = connection.connection.dbapi_connection.parameters
+
+    assert indexes == [
+        {
+            "name": "entry_account",
+            "column_names": ["account_id", "id"],
+            "unique": False,
+            "dialect_options": {
+                "interbase_descending": True,
+                "interbase_where": None,
+                "interbase_statistics": 0.01,
+                "interbase_inactive": True,
+            },
+        },
+    ]
+    query = next(statement for statement in statements if "rdb$indices ix" in statement)
+    assert "ix.rdb$relation_name = LTRIM(RTRIM(?))" in query
+    assert parameters[statements.index(query)] == ("ENTRY",)
+
+
+def test_multi_indexes_inactive_and_statistics(make_engine, statements, results):
+    engine = make_engine()
+    reflection_results(results)
+    results["rdb$indices ix"] = (INDEX_NAMES, index_rows())
+
+    indexes = inspect(engine).get_multi_indexes()
+
+    options = {
+        key: [(index["name"], index["dialect_options"]) for index in value]
+        for key, value in indexes.items()
+    }
+    assert options[(None, "account")] == [
+        (
+            "account_name",
+            {
+                "interbase_descending": False,
+                "interbase_where": None,
+                "interbase_statistics": 0.5,
+                "interbase_inactive": False,
+            },
+        ),
+    ]
+    assert options[(None, "entry")][0][1]["interbase_inactive"] is True
+    assert options[(None, "empty")] == []
+    assert len([statement for statement in statements if "rdb$indices ix" in statement]) == 1
@@ -0,0 +1,53 @@
+from sqlalchemy.engine import make_url
+
+from sqlalchemy_interbase.reflection_cache import FINGERPRINT_QUERY, ReflectionCache
+
+
+def make_cache(tmp_path):
+    return ReflectionCache(str(tmp_path), make_url("interbase://u:p@localhost/x.ib"))
+
+
+def test_load_saved(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.save((1, 2), {"a": 1, "b": 2})
+
+    other = make_cache(tmp_path)
+    assert other.load((1, 2)) == {"a": 1, "b": 2}
+    assert other.saved_size == 2
+    assert other.load((1, 3)) is None
+
+
+def test_save_unsaved(tmp_path):
+    cache = make_cache(tmp_path)
+    info_cache = {"a": 1}
+    cache.save((1,), info_cache)
+    mtime = tmp_path.joinpath(cache.path).stat().st_mtime_ns
+
+    cache.save_unsaved((1,), info_cache)
+    assert tmp_path.joinpath(cache.path).stat().st_mtime_ns == mtime
+
+    info_cache["b"] = 2
+    cache.save_unsaved((1,), info_cache)
+    assert make_cache(tmp_path).load((1,)) == info_cache
+
+
+def test_clear(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.save((1,), {"a": 1})
+    cache.clear()
+
+    assert cache.saved_size == 0
+    assert cache.load((1,)) is None
+
+
+def test_file_per_user(tmp_path):
+    cache = make_cache(tmp_path)
+    other = ReflectionCache(str(tmp_path), make_url("interbase://v:p@localhost/x.ib"))
+
+    assert other.path != cache.path
+    assert make_cache(tmp_path).path == cache.path
+
+
+def test_fingerprint_of_index_state():
+    assert "SUM(COALESCE(rdb$index_inactive, 0)) FROM rdb$indices" in FINGERPRINT_QUERY
+    assert "SUM(rdb$statistics) FROM rdb$indices" in FINGERPRINT_QUERY
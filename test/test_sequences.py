@@ -0,0 +1,86 @@
+import threading
+
+from sqlalchemy import Column, Integer, MetaData, Sequence, Table, insert
+
+from sqlalchemy_interbase.base import _SequenceBlocks
+
+
+def test_block_handed_out_locally():
+    blocks = _SequenceBlocks()
+    reserved = []
+
+    def reserve_block(n):
+        reserved.append(n)
+        return 10 * len(reserved)
+
+    values = [blocks.next_value("S", 10, reserve_block) for _ in range(25)]
+
+    assert values == list(range(1, 26))
+    assert reserved == [10, 10, 10]
+
+
+def test_blocks_per_sequence():
+    blocks = _SequenceBlocks()
+
+    assert blocks.next_value("A", 5, lambda n: 5) == 1
+    assert blocks.next_value("B", 5, lambda n: 105) == 101
+    assert blocks.next_value("A", 5, lambda n: 10) == 2
+
+
+def test_values_unique_across_threads():
+    blocks = _SequenceBlocks()
+    counter = iter(range(100, 100000, 100))
+    values = []
+
+    def allocate():
+        values.extend(blocks.next_value("S", 100, lambda n: next(counter)) for _ in range(500))
+
+    threads = [threading.Thread(target=allocate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(values) == list(range(1, 2001))
+
+
+def make_table(sequence):
+    return Table(
+        "t",
+        MetaData(),
+        Column("id", Integer, sequence, primary_key=True),
+        Column("n", Integer),
+        implicit_returning=False,
+    )
+
+
+def test_fire_sequence_reserves_block(make_engine, statements, results):
+    engine = make_engine()
+    sequence = Sequence("t_seq")
+    sequence.info["interbase_block_size"] = 3
+    table = make_table(sequence)
+    results["GEN_ID"] = (("gen_id",), [(3,)])
+
+    with engine.connect() as connection:
+        for n in range(3):
+            connection.execute(insert(table), {"n": n})
+        parameters = connection.connection.dbapi_connection.parameters
+
+    assert [statement for statement in statements if "GEN_ID" in statement] == [
+        "SELECT GEN_ID(t_seq, 3) FROM rdb$database"
+    ]
+    assert [p for p in parameters if p and len(p) == 2] == [(1, 0), (2, 1), (3, 2)]
+
+
+def test_fire_sequence_without_block(make_engine, statements, results):
+    engine = make_engine()
+    table = make_table(Sequence("t_seq"))
+    results["GEN_ID"] = (("gen_id",), [(7,)])
+
+    with engine.connect() as connection:
+        connection.execute(insert(table), {"n": 1})
+        connection.execute(insert(table), {"n": 2})
+
+    assert [statement for statement in statements if "GEN_ID" in statement] == [
+        "SELECT GEN_ID(t_seq, 1) FROM rdb$database"
+    ] * 2
@@ -0,0 +1,66 @@
+import interbase
+import pytest
+from sqlalchemy import exc, text
+
+
+def cache_of(connection):
+    return connection.connection.info["interbase_statement_cache"]
+
+
+def test_hit(make_engine, results):
+    engine = make_engine(statement_cache_size=10)
+    results["FROM t"] = (("n",), [(1,)])
+
+    with engine.connect() as connection:
+        for n in range(3):
+            assert connection.execute(text("SELECT n FROM t WHERE n = :n"), {"n": n}).all() == [(1,)]
+        cache = cache_of(connection)
+        prepared = connection.connection.dbapi_connection.prepared
+
+    assert prepared == ["SELECT n FROM t WHERE n = ?"]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_eviction(make_engine):
+    engine = make_engine(statement_cache_size=2)
+
+    with engine.connect() as connection:
+        for table in ("a", "b", "a", "c", "b"):
+            connection.execute(text("UPDATE %s SET n = 1" % table))
+        cache = cache_of(connection)
+        prepared = connection.connection.dbapi_connection.prepared
+
+    # b is the least recently used when c is prepared
+    assert prepared == ["UPDATE a SET n = 1", "UPDATE b SET n = 1", "UPDATE c SET n = 1", "UPDATE b SET n = 1"]
+    assert len(cache) == 2
+
+
+def test_released_on_error(make_engine, results):
+    engine = make_engine(statement_cache_size=10)
+    results["UPDATE t"] = interbase.DatabaseError("lock conflict")
+
+    with engine.connect() as connection:
+        with pytest.raises(exc.DatabaseError):
+            connection.execute(text("UPDATE t SET n = 1"))
+        connection.rollback()
+        del results["UPDATE t"]
+        connection.execute(text("UPDATE t SET n = 1"))
+        cache = cache_of(connection)
+        dbapi_connection = connection.connection.dbapi_connection
+
+    # The statement was released, the second execution reuses it
+    assert dbapi_connection.prepared == ["UPDATE t SET n = 1"]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert all(cursor.closed for cursor in dbapi_connection.cursors)
+
+
+def test_cleared_by_ddl(make_engine):
+    engine = make_engine(statement_cache_size=10)
+
+    with engine.connect() as connection:
+        connection.execute(text("UPDATE t SET n = 1"))
+        connection.execute(text("ALTER TABLE t ADD m INTEGER"))
+        connection.execute(text("UPDATE t SET n = 1"))
+        prepared = connection.connection.dbapi_connection.prepared
+
+    assert prepared == ["UPDATE t SET n = 1"] * 2
@@ -0,0 +1,42 @@
+import interbase as ib
+import pytest
+from sqlalchemy import exc
+
+from sqlalchemy_interbase.base import _DEFAULT_TPB_OPTIONS, _render_tpb
+
+
+def render(**options):
+    return _render_tpb(dict(_DEFAULT_TPB_OPTIONS, **options))
+
+
+@pytest.mark.parametrize(
+    "isolation_level, codes",
+    [
+        ("READ COMMITTED", [ib.isc_tpb_read_committed, ib.isc_tpb_rec_version]),
+        ("REPEATABLE READ", [ib.isc_tpb_concurrency]),
+        ("SERIALIZABLE", [ib.isc_tpb_consistency]),
+    ],
+)
+def test_isolation_levels(isolation_level, codes):
+    assert render(isolation_level=isolation_level) == bytes(
+        [ib.isc_tpb_version3, ib.isc_tpb_write, *codes, ib.isc_tpb_wait]
+    )
+
+
+def test_read_only_no_rec_version_nowait():
+    assert render(read_only=True, rec_version=False, wait=False) == bytes(
+        [
+            ib.isc_tpb_version3,
+            ib.isc_tpb_read,
+            ib.isc_tpb_read_committed,
+            ib.isc_tpb_no_rec_version,
+            ib.isc_tpb_nowait,
+        ]
+    )
+
+
+def test_lock_timeout_rejected(make_engine):
+    engine = make_engine()
+    with engine.connect() as connection:
+        with pytest.raises(exc.ArgumentError, match="interbase_lock_timeout"):
+            connection.execution_options(interbase_lock_timeout=10)